@@ -10,13 +10,20 @@ Author: GitHub Copilot
 Date: June 2025
 """
 
-import requests
+import httpx
+import asyncio
+import contextvars
 import time
 import sys
+import functools
+import math
+import random
+import threading
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
 from dataclasses import dataclass
 import json
+import numpy as np
 
 # Import configuration
 import config
@@ -28,8 +35,147 @@ try:
 except ImportError:
     COLORS_AVAILABLE = False
 
+# Color prefixes resolved once at import (empty strings when colorama is missing)
+if COLORS_AVAILABLE:
+    _RED, _GREEN, _YELLOW = Fore.RED, Fore.GREEN, Fore.YELLOW
+    _BLUE, _MAGENTA, _CYAN = Fore.BLUE, Fore.MAGENTA, Fore.CYAN
+    _RESET = Style.RESET_ALL
+else:
+    _RED = _GREEN = _YELLOW = _BLUE = _MAGENTA = _CYAN = _RESET = ''
 
-@dataclass
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Slack allowed on incrementally updated inverse-odds sums before exact recomputation
+_INVERSE_SUM_TOLERANCE = 1e-9
+
+
+def _arbitrage_kernel(odds_matrix: np.ndarray, total_stake: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scalar-loop arbitrage kernel, compiled with Numba when it is installed
+    
+    Args:
+        odds_matrix: 2-D array of decimal odds, NaN-padded per row
+        total_stake: Total amount to stake on each market
+        
+    Returns:
+        Tuple of (arbitrage percentage per market, unrounded stakes matrix)
+    """
+    n_markets, n_outcomes = odds_matrix.shape
+    arbitrage_percentage = np.zeros(n_markets)
+    stakes = np.full((n_markets, n_outcomes), np.nan)
+    
+    for m in range(n_markets):
+        # Neumaier-compensated sum, so rounding drift can't flip a result
+        # at the 1.0 boundary
+        inverse_sum = 0.0
+        compensation = 0.0
+        for o in range(n_outcomes):
+            odd = odds_matrix[m, o]
+            if not np.isnan(odd):
+                term = 1.0 / odd
+                total = inverse_sum + term
+                if abs(inverse_sum) >= abs(term):
+                    compensation += (inverse_sum - total) + term
+                else:
+                    compensation += (term - total) + inverse_sum
+                inverse_sum = total
+        inverse_sum += compensation
+        arbitrage_percentage[m] = inverse_sum
+        
+        if inverse_sum > 0.0:
+            scale = total_stake / inverse_sum
+            for o in range(n_outcomes):
+                odd = odds_matrix[m, o]
+                if not np.isnan(odd):
+                    stakes[m, o] = scale * (1.0 / odd)
+                    
+    return arbitrage_percentage, stakes
+
+
+if NUMBA_AVAILABLE:
+    _arbitrage_kernel = njit(cache=True)(_arbitrage_kernel)
+
+
+# Unrolled forms of the arbitrage math for 2-way and 3-way markets, which
+# make up nearly all markets; longer markets use the generic loops
+def _arb_pct_2(a: float, b: float) -> float:
+    return 1.0 / a + 1.0 / b
+
+
+def _arb_pct_3(a: float, b: float, c: float) -> float:
+    return math.fsum((1.0 / a, 1.0 / b, 1.0 / c))
+
+
+def _stakes_2(a: float, b: float, total_stake: float) -> List[float]:
+    f = total_stake / (1.0 / a + 1.0 / b)
+    return [round(f * (1.0 / a), 2), round(f * (1.0 / b), 2)]
+
+
+def _stakes_3(a: float, b: float, c: float, total_stake: float) -> List[float]:
+    f = total_stake / _arb_pct_3(a, b, c)
+    return [round(f * (1.0 / a), 2), round(f * (1.0 / b), 2), round(f * (1.0 / c), 2)]
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_commence(commence_time: str) -> str:
+    """Format an ISO commence time for display, cached per distinct timestamp"""
+    return datetime.fromisoformat(commence_time.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S UTC')
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retrying a failed request
+    
+    A numeric Retry-After header from the server wins. Otherwise the delay
+    doubles per attempt from RETRY_DELAY up to RETRY_MAX_DELAY, with jitter
+    so concurrent requests don't all retry at the same moment.
+    
+    Args:
+        attempt: Zero-based attempt that just failed
+        retry_after: Retry-After header value, if any
+        
+    Returns:
+        Delay in seconds
+    """
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    delay = min(config.RETRY_MAX_DELAY, config.RETRY_DELAY * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class Outcome(NamedTuple):
+    """One leg of an arbitrage opportunity"""
+    name: str
+    odds: float
+    bookmaker: str
+    bookmaker_key: str
+    stake: float
+
+
+@dataclass(slots=True, frozen=True)
 class ArbitrageOpportunity:
     """Data class to represent an arbitrage opportunity"""
     event_id: str
@@ -37,22 +183,139 @@ class ArbitrageOpportunity:
     home_team: str
     away_team: str
     commence_time: str
-    outcomes: List[Dict]
+    outcomes: Tuple[Outcome, ...]
     arbitrage_percentage: float
     profit_margin: float
     guaranteed_profit: float
     total_stake: float
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_session() -> httpx.Client:
+    """
+    Get the process-wide HTTP client shared by every OddsAPIClient
+    
+    HTTP/2 lets concurrent calls share one multiplexed TLS connection, and
+    sharing the client means the handshake is paid once per process rather
+    than once per finder. The transport retries failed connection attempts;
+    HTTP-level retries (429, 5xx) stay in OddsAPIClient._make_request.
+    """
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=config.MAX_RETRIES,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+    return httpx.Client(transport=transport, timeout=config.REQUEST_TIMEOUT)
+
+
+class TokenBucket:
+    """Client-side token bucket that spaces requests out below the server limit"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def _reserve(self) -> float:
+        """
+        Take one token, letting the balance go negative when the bucket is empty
+        
+        Returns:
+            Seconds the caller must wait before its token becomes valid
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def throttle(self):
+        """Halve the refill rate after the server rejected a request"""
+        with self._lock:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+    
+    def recover(self):
+        """Step the refill rate back up towards its configured maximum"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class _AsyncBatch(NamedTuple):
+    """Request state owned by one _gather call"""
+    session: 'aiohttp.ClientSession'
+    semaphore: asyncio.Semaphore
+    inflight: Dict[Tuple, asyncio.Future]
+
+
+class StreamInterruptedError(Exception):
+    """A streamed odds response broke after some of its events were already yielded"""
+
+
 class OddsAPIClient:
     """Client for interacting with The Odds API"""
     
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = config.BASE_URL
-        self.session = requests.Session()
+        self.session = _shared_session()
         self.requests_remaining = None
         self.requests_used = None
+        # The _AsyncBatch of the running _gather, seen only by the tasks it spawns,
+        # so overlapping top-level async calls each keep their own session
+        self._batch: contextvars.ContextVar = contextvars.ContextVar('odds_api_batch', default=None)
+        self.limiter = TokenBucket(rate=config.MAX_RPS, capacity=config.BURST)
+        self._odds_cache: Dict[Tuple, Tuple[float, List[Dict]]] = {}
+        
+    def _cached_odds(self, key: Tuple) -> Optional[List[Dict]]:
+        """
+        Look up a recent odds response
+        
+        Args:
+            key: (sport, regions, markets, odds_format) tuple
+            
+        Returns:
+            Cached events or None if missing or older than ODDS_CACHE_TTL
+        """
+        entry = self._odds_cache.get(key)
+        
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > config.ODDS_CACHE_TTL:
+            del self._odds_cache[key]
+            return None
+            
+        return entry[1]
+    
+    def _store_odds(self, key: Tuple, events: Optional[List[Dict]]):
+        """
+        Remember a successful odds response, evicting the oldest entry when full
+        
+        Args:
+            key: (sport, regions, markets, odds_format) tuple
+            events: Events returned by the API (failed requests are not cached)
+        """
+        if events is None:
+            return
+        if len(self._odds_cache) >= config.ODDS_CACHE_SIZE:
+            del self._odds_cache[next(iter(self._odds_cache))]
+            
+        self._odds_cache[key] = (time.monotonic(), events)
         
     def _make_request(self, endpoint: str, params: Dict) -> Optional[Dict]:
         """
@@ -70,11 +333,8 @@ class OddsAPIClient:
         
         for attempt in range(config.MAX_RETRIES):
             try:
-                response = self.session.get(
-                    url, 
-                    params=params, 
-                    timeout=config.REQUEST_TIMEOUT
-                )
+                self.limiter.acquire()
+                response = self.session.get(url, params=params)
                 
                 # Update rate limit information
                 self.requests_remaining = response.headers.get('x-requests-remaining')
@@ -82,22 +342,173 @@ class OddsAPIClient:
                 
                 # Check rate limiting
                 if response.status_code == 429:
-                    print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  Rate limit exceeded. Retrying in {config.RETRY_DELAY} seconds...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-                    time.sleep(config.RETRY_DELAY)
+                    delay = _retry_delay(attempt, response.headers.get('retry-after'))
+                    print(f"{_YELLOW}⚠️  Rate limit exceeded. Retrying in {delay:.1f} seconds...{_RESET}")
+                    self.limiter.throttle()
+                    time.sleep(delay)
                     continue
                     
                 response.raise_for_status()
+                self.limiter.recover()
                 
                 # Warn if requests are running low
                 if self.requests_remaining and int(self.requests_remaining) < config.MIN_REQUESTS_REMAINING:
-                    print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  Warning: Only {self.requests_remaining} API requests remaining!{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+                    print(f"{_YELLOW}⚠️  Warning: Only {self.requests_remaining} API requests remaining!{_RESET}")
                 
-                return response.json()
+                return _json_loads(response.content)
                 
-            except requests.exceptions.RequestException as e:
-                print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Request failed (attempt {attempt + 1}/{config.MAX_RETRIES}): {e}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            # ValueError covers malformed bodies (orjson and json decode errors)
+            except (httpx.HTTPError, ValueError) as e:
+                print(f"{_RED}❌ Request failed (attempt {attempt + 1}/{config.MAX_RETRIES}): {e}{_RESET}")
                 if attempt < config.MAX_RETRIES - 1:
-                    time.sleep(config.RETRY_DELAY)
+                    time.sleep(_retry_delay(attempt))
+                else:
+                    return None
+                    
+        return None
+    
+    def _stream_request(self, endpoint: str, params: Dict) -> Iterator[Dict]:
+        """
+        Stream the items of a JSON array response as they are downloaded
+        
+        Items are parsed incrementally with ijson so callers can start work
+        before the body has fully arrived. Bodies smaller than
+        STREAM_MIN_BYTES are parsed in one go. If the stream fails before
+        yielding anything, the buffered, retrying _make_request is used.
+        
+        Args:
+            endpoint: API endpoint
+            params: Request parameters
+            
+        Yields:
+            Items of the top-level JSON array
+            
+        Raises:
+            StreamInterruptedError: The stream failed after items were yielded,
+                so the items seen so far are not the complete response
+        """
+        url = f"{self.base_url}{endpoint}"
+        params['apiKey'] = self.api_key
+        produced = False
+        
+        try:
+            self.limiter.acquire()
+            with self.session.stream('GET', url, params=params) as response:
+                # Update rate limit information
+                self.requests_remaining = response.headers.get('x-requests-remaining')
+                self.requests_used = response.headers.get('x-requests-used')
+                
+                response.raise_for_status()
+                self.limiter.recover()
+                
+                # Warn if requests are running low
+                if self.requests_remaining and int(self.requests_remaining) < config.MIN_REQUESTS_REMAINING:
+                    print(f"{_YELLOW}⚠️  Warning: Only {self.requests_remaining} API requests remaining!{_RESET}")
+                
+                content_length = int(response.headers.get('content-length') or 0)
+                if 0 < content_length < config.STREAM_MIN_BYTES:
+                    items = _json_loads(response.read())
+                    produced = True
+                    yield from items
+                    return
+                
+                items = ijson.sendable_list()
+                # Floats rather than Decimals, matching the buffered parse
+                parser = ijson.items_coro(items, 'item', use_float=True)
+                
+                for chunk in response.iter_bytes():
+                    parser.send(chunk)
+                    if items:
+                        produced = True
+                        yield from items
+                        del items[:]
+                        
+                parser.close()
+                yield from items
+                
+        except (httpx.HTTPError, ijson.JSONError, ValueError) as e:
+            if produced:
+                raise StreamInterruptedError(f"Streamed request failed part-way: {e}") from e
+            yield from self._make_request(endpoint, params) or []
+    
+    async def _make_request_async(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """
+        Async counterpart of _make_request for concurrent fetches
+        
+        Identical requests issued while one is already in flight in the same
+        batch share its result instead of sending another round-trip.
+        
+        Args:
+            endpoint: API endpoint
+            params: Request parameters
+            
+        Returns:
+            JSON response data or None if request fails
+        """
+        batch = self._batch.get()
+        inflight = batch.inflight
+        key = (endpoint, tuple(sorted(params.items())))
+        task = inflight.get(key)
+        
+        if task is None:
+            task = inflight[key] = asyncio.ensure_future(self._send_request_async(batch, endpoint, params))
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+            
+        return await asyncio.shield(task)
+    
+    async def _send_request_async(self, batch: _AsyncBatch, endpoint: str, params: Dict) -> Optional[Dict]:
+        """
+        Send one request on the batch's pooled aiohttp session, with retries
+        
+        Args:
+            batch: Session and concurrency limit of the calling _gather
+            endpoint: API endpoint
+            params: Request parameters
+            
+        Returns:
+            JSON response data or None if request fails
+        """
+        url = f"{self.base_url}{endpoint}"
+        params['apiKey'] = self.api_key
+        timeout = aiohttp.ClientTimeout(total=config.REQUEST_TIMEOUT)
+        
+        for attempt in range(config.MAX_RETRIES):
+            try:
+                # Only hold a concurrency slot while the request is in flight
+                await self.limiter.acquire_async()
+                async with batch.semaphore:
+                    async with batch.session.get(url, params=params, timeout=timeout) as response:
+                        # Update rate limit information
+                        self.requests_remaining = response.headers.get('x-requests-remaining')
+                        self.requests_used = response.headers.get('x-requests-used')
+                        
+                        rate_limited = response.status == 429
+                        retry_after = response.headers.get('retry-after')
+                        if not rate_limited:
+                            response.raise_for_status()
+                            data = _json_loads(await response.read())
+                
+                if rate_limited:
+                    # Each coroutine backs off on its own, so other fetches keep going
+                    delay = _retry_delay(attempt, retry_after)
+                    print(f"{_YELLOW}⚠️  Rate limit exceeded. Retrying in {delay:.1f} seconds...{_RESET}")
+                    self.limiter.throttle()
+                    await asyncio.sleep(delay)
+                    continue
+                
+                self.limiter.recover()
+                
+                # Warn if requests are running low
+                if self.requests_remaining and int(self.requests_remaining) < config.MIN_REQUESTS_REMAINING:
+                    print(f"{_YELLOW}⚠️  Warning: Only {self.requests_remaining} API requests remaining!{_RESET}")
+                
+                return data
+                
+            # ValueError covers malformed bodies and rate limit headers
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                print(f"{_RED}❌ Request failed (attempt {attempt + 1}/{config.MAX_RETRIES}): {e}{_RESET}")
+                if attempt < config.MAX_RETRIES - 1:
+                    await asyncio.sleep(_retry_delay(attempt))
                 else:
                     return None
                     
@@ -113,7 +524,7 @@ class OddsAPIClient:
         return self._make_request('/v4/sports', {})
     
     def get_odds(self, sport: str, regions: List[str], markets: List[str], 
-                 odds_format: str = 'decimal') -> Optional[List[Dict]]:
+                 odds_format: str = 'decimal', stream: bool = False):
         """
         Get odds for a specific sport
         
@@ -122,9 +533,13 @@ class OddsAPIClient:
             regions: List of regions
             markets: List of markets
             odds_format: Format for odds (decimal, american)
+            stream: Return an iterator that yields events while the
+                response is still downloading
             
         Returns:
-            List of events with odds or None if request fails
+            List of events with odds or None if request fails; with
+            stream=True, an iterator of events (empty if request fails)
+            that raises StreamInterruptedError if the download breaks part-way
         """
         params = {
             'regions': ','.join(regions),
@@ -133,7 +548,53 @@ class OddsAPIClient:
             'dateFormat': 'iso'
         }
         
-        return self._make_request(f'/v4/sports/{sport}/odds', params)
+        key = (sport, tuple(regions), tuple(markets), odds_format)
+        
+        if stream:
+            return self._iter_odds(key, f'/v4/sports/{sport}/odds', params)
+            
+        events = self._cached_odds(key)
+        
+        if events is None:
+            events = self._make_request(f'/v4/sports/{sport}/odds', params)
+            self._store_odds(key, events)
+            
+        return events
+    
+    def _iter_odds(self, key: Tuple, endpoint: str, params: Dict) -> Iterator[Dict]:
+        """
+        Yield odds events from the cache or a streamed request, caching the result
+        
+        Only a stream that ran to completion is cached; an interrupted one
+        raises StreamInterruptedError out of the loop before the store.
+        
+        Args:
+            key: (sport, regions, markets, odds_format) tuple
+            endpoint: API endpoint
+            params: Request parameters
+            
+        Yields:
+            Events with odds
+        """
+        events = self._cached_odds(key)
+        
+        if events is not None:
+            yield from events
+            return
+            
+        if not IJSON_AVAILABLE:
+            events = self._make_request(endpoint, params)
+            self._store_odds(key, events)
+            yield from events or []
+            return
+            
+        events = []
+        for event in self._stream_request(endpoint, params):
+            events.append(event)
+            yield event
+            
+        if events:
+            self._store_odds(key, events)
     
     def get_historical_odds(self, sport: str, regions: List[str], markets: List[str], 
                            date: str, odds_format: str = 'decimal') -> Optional[List[Dict]]:
@@ -159,6 +620,138 @@ class OddsAPIClient:
         }
         
         return self._make_request(f'/v4/historical/sports/{sport}/odds', params)
+    
+    async def get_odds_async(self, sport: str, regions: List[str], markets: List[str],
+                             odds_format: str = 'decimal') -> Optional[List[Dict]]:
+        """
+        Get odds for a specific sport without blocking the event loop
+        
+        Args:
+            sport: Sport key
+            regions: List of regions
+            markets: List of markets
+            odds_format: Format for odds (decimal, american)
+            
+        Returns:
+            List of events with odds or None if request fails
+        """
+        if self._batch.get() is None:
+            results = await self.get_odds_many([sport], regions, markets, odds_format)
+            return results[sport]
+        
+        params = {
+            'regions': ','.join(regions),
+            'markets': ','.join(markets),
+            'oddsFormat': odds_format,
+            'dateFormat': 'iso'
+        }
+        
+        key = (sport, tuple(regions), tuple(markets), odds_format)
+        events = self._cached_odds(key)
+        
+        if events is None:
+            events = await self._make_request_async(f'/v4/sports/{sport}/odds', params)
+            self._store_odds(key, events)
+            
+        return events
+    
+    async def get_odds_many(self, sports: List[str], regions: List[str], markets: List[str],
+                            odds_format: str = 'decimal') -> Dict[str, Optional[List[Dict]]]:
+        """
+        Get odds for several sports concurrently
+        
+        Args:
+            sports: List of sport keys
+            regions: List of regions
+            markets: List of markets
+            odds_format: Format for odds (decimal, american)
+            
+        Returns:
+            Mapping of sport key to its events (None where the request failed)
+        """
+        results = await self._gather(
+            [self.get_odds_async(sport, regions, markets, odds_format) for sport in sports]
+        )
+        
+        return dict(zip(sports, results))
+    
+    async def get_historical_odds_async(self, sport: str, regions: List[str], markets: List[str],
+                                        date: str, odds_format: str = 'decimal') -> Optional[List[Dict]]:
+        """
+        Get historical odds for a specific sport and date without blocking the event loop
+        
+        Args:
+            sport: Sport key
+            regions: List of regions
+            markets: List of markets
+            date: Date in ISO format (YYYY-MM-DDTHH:MM:SSZ)
+            odds_format: Format for odds (decimal, american)
+            
+        Returns:
+            List of events with historical odds or None if request fails
+        """
+        if self._batch.get() is None:
+            results = await self.get_historical_odds_many(sport, regions, markets, [date], odds_format)
+            return results[date]
+        
+        params = {
+            'regions': ','.join(regions),
+            'markets': ','.join(markets),
+            'oddsFormat': odds_format,
+            'dateFormat': 'iso',
+            'date': date
+        }
+        
+        return await self._make_request_async(f'/v4/historical/sports/{sport}/odds', params)
+    
+    async def get_historical_odds_many(self, sport: str, regions: List[str], markets: List[str],
+                                       dates: List[str], odds_format: str = 'decimal') -> Dict[str, Optional[List[Dict]]]:
+        """
+        Get historical odds snapshots for several dates concurrently
+        
+        Args:
+            sport: Sport key
+            regions: List of regions
+            markets: List of markets
+            dates: Dates in ISO format (YYYY-MM-DDTHH:MM:SSZ)
+            odds_format: Format for odds (decimal, american)
+            
+        Returns:
+            Mapping of date to its events (None where the request failed)
+        """
+        results = await self._gather(
+            [self.get_historical_odds_async(sport, regions, markets, date, odds_format) for date in dates]
+        )
+        
+        return dict(zip(dates, results))
+    
+    async def _gather(self, coros: List) -> List:
+        """
+        Run request coroutines concurrently over one pooled aiohttp session
+        
+        Args:
+            coros: Coroutines that issue requests through _make_request_async
+            
+        Returns:
+            Their results, in order, with None for any coroutine that raised
+        """
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=10)
+        
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # gather() copies the current context into each task it creates
+            token = self._batch.set(_AsyncBatch(session, asyncio.Semaphore(config.MAX_CONCURRENCY), {}))
+            try:
+                results = await asyncio.gather(*coros, return_exceptions=True)
+            finally:
+                self._batch.reset(token)
+        
+        # One failed fetch must not discard the results of the others
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                print(f"{_RED}❌ Request failed: {result!r}{_RESET}")
+                results[i] = None
+                
+        return results
 
 
 class ArbitrageCalculator:
@@ -170,12 +763,20 @@ class ArbitrageCalculator:
         Calculate arbitrage percentage for given odds
         
         Args:
-            odds: List of decimal odds for all outcomes
+            odds: List or NumPy array of decimal odds for all outcomes
             
         Returns:
             Arbitrage percentage (< 1.0 indicates arbitrage opportunity)
         """
-        return sum(1.0 / odd for odd in odds)
+        if isinstance(odds, np.ndarray):
+            return float(np.reciprocal(odds.astype(float, copy=False)).sum())
+        # A single addition is already correctly rounded; longer sums use
+        # fsum so rounding drift can't flip a result at the 1.0 boundary
+        if len(odds) == 2:
+            return _arb_pct_2(*odds)
+        if len(odds) == 3:
+            return _arb_pct_3(*odds)
+        return math.fsum(1.0 / odd for odd in odds)
     
     @staticmethod
     def calculate_stakes(odds: List[float], total_stake: float) -> List[float]:
@@ -189,6 +790,11 @@ class ArbitrageCalculator:
         Returns:
             List of stakes for each outcome
         """
+        if len(odds) == 2:
+            return _stakes_2(*odds, total_stake)
+        if len(odds) == 3:
+            return _stakes_3(*odds, total_stake)
+            
         arbitrage_percentage = ArbitrageCalculator.calculate_arbitrage_percentage(odds)
         stakes = []
         
@@ -220,6 +826,49 @@ class ArbitrageCalculator:
         # Calculate profit for any outcome (should be the same for all)
         profit = (stakes[0] * odds[0]) - total_stake
         return round(profit, 2)
+    
+    @staticmethod
+    def calc_batch(odds_matrix: np.ndarray, total_stake: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate arbitrage for many markets in one vectorized pass
+        
+        Args:
+            odds_matrix: 2-D array of decimal odds, one market per row,
+                padded with NaN where a market has fewer outcomes
+            total_stake: Total amount to stake on each market
+            
+        Returns:
+            Tuple of (arbitrage percentage per market, stakes matrix,
+            guaranteed profit per market); stakes are rounded to the cent
+            only on arbitrage rows
+        """
+        if NUMBA_AVAILABLE:
+            arbitrage_percentage, stakes = _arbitrage_kernel(odds_matrix, float(total_stake))
+        else:
+            inverse_odds = 1.0 / odds_matrix
+            arbitrage_percentage = np.nansum(inverse_odds, axis=1)
+            
+            # Re-sum the candidate rows exactly, as the plain summation can
+            # drift across the 1.0 boundary
+            for m in np.nonzero(arbitrage_percentage < 1.0 + _INVERSE_SUM_TOLERANCE)[0]:
+                arbitrage_percentage[m] = math.fsum(x for x in inverse_odds[m].tolist() if not math.isnan(x))
+            
+            # Rows without any outcomes have a zero sum; their stakes are meaningless
+            with np.errstate(divide='ignore', invalid='ignore'):
+                stakes = (total_stake / arbitrage_percentage[:, None]) * inverse_odds
+        
+        # np.round scales by 100 before rounding and can land a cent away from
+        # round(), so the few arbitrage rows are rounded like the scalar path
+        profit = np.zeros(len(arbitrage_percentage))
+        
+        for m in np.nonzero(arbitrage_percentage < 1.0)[0]:
+            row_stakes = [round(stake, 2) for stake in stakes[m].tolist()]
+            stakes[m] = row_stakes
+            
+            # Calculate profit for the first outcome (should be the same for all)
+            profit[m] = round(row_stakes[0] * float(odds_matrix[m, 0]) - total_stake, 2)
+        
+        return arbitrage_percentage, stakes, profit
 
 
 class ArbitrageFinder:
@@ -229,6 +878,11 @@ class ArbitrageFinder:
         self.client = OddsAPIClient(api_key)
         self.calculator = ArbitrageCalculator()
         
+        # Bookmaker lookup table shared by every analyzed event
+        self._bm_index: Dict[str, int] = {}
+        self._bm_keys: List[str] = []
+        self._bm_titles: List[str] = []
+        
     def find_arbitrage_opportunities(self, sport: str, regions: List[str], 
                                    markets: List[str], bet_size: float) -> List[ArbitrageOpportunity]:
         """
@@ -243,121 +897,269 @@ class ArbitrageFinder:
         Returns:
             List of arbitrage opportunities
         """
-        print(f"{Fore.BLUE if COLORS_AVAILABLE else ''}🔍 Fetching odds data for {config.AVAILABLE_SPORTS.get(sport, sport)}...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_BLUE}🔍 Fetching odds data for {config.AVAILABLE_SPORTS.get(sport, sport)}...{_RESET}")
         
-        events_data = self.client.get_odds(sport, regions, markets)
+        # Candidates are collected as events stream in, overlapping the
+        # download with ingest; the arbitrage math still runs once at the end
+        rows = []
+        event_count = 0
         
-        if not events_data:
-            print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Failed to fetch odds data{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-            return []
+        try:
+            for event in self.client.get_odds(sport, regions, markets, stream=True):
+                event_count += 1
+                rows.extend((event, *candidate) for candidate in self._collect_candidates(event))
+        except StreamInterruptedError as e:
+            # A partial slate would under-report; start over from a buffered, retrying fetch
+            print(f"{_YELLOW}⚠️  {e}; refetching without streaming...{_RESET}")
+            rows = []
+            events = self.client.get_odds(sport, regions, markets) or []
+            event_count = len(events)
+            for event in events:
+                rows.extend((event, *candidate) for candidate in self._collect_candidates(event))
             
-        if not events_data:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  No events found for {sport}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        if not event_count:
+            print(f"{_RED}❌ Failed to fetch odds data{_RESET}")
             return []
             
-        print(f"{Fore.GREEN if COLORS_AVAILABLE else ''}✅ Found {len(events_data)} events{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_GREEN}✅ Found {event_count} events{_RESET}")
         
-        opportunities = []
+        return self._evaluate_candidates(rows, bet_size)
+    
+    async def find_arbitrage_opportunities_many(self, sports: List[str], regions: List[str],
+                                                markets: List[str], bet_size: float) -> List[ArbitrageOpportunity]:
+        """
+        Find arbitrage opportunities across several sports, fetching odds concurrently
+        
+        Args:
+            sports: List of sport keys
+            regions: List of regions to check
+            markets: List of markets to analyze
+            bet_size: Total amount to bet
+            
+        Returns:
+            List of arbitrage opportunities
+        """
+        print(f"{_BLUE}🔍 Fetching odds data for {len(sports)} sports...{_RESET}")
         
-        for event in events_data:
-            event_opportunities = self._analyze_event(event, bet_size)
-            opportunities.extend(event_opportunities)
+        odds_by_sport = await self.client.get_odds_many(sports, regions, markets)
+        
+        events = []
+        
+        for sport, events_data in odds_by_sport.items():
+            if not events_data:
+                print(f"{_RED}❌ Failed to fetch odds data for {config.AVAILABLE_SPORTS.get(sport, sport)}{_RESET}")
+                continue
+                
+            print(f"{_GREEN}✅ Found {len(events_data)} events for {config.AVAILABLE_SPORTS.get(sport, sport)}{_RESET}")
             
-        return opportunities
+            events.extend(events_data)
+                
+        return self._analyze_events(events, bet_size)
     
-    def _analyze_event(self, event: Dict, bet_size: float) -> List[ArbitrageOpportunity]:
+    def find_arbitrage_opportunities_for_sports(self, sports: List[str], regions: List[str],
+                                                markets: List[str], bet_size: float) -> List[ArbitrageOpportunity]:
         """
-        Analyze a single event for arbitrage opportunities
+        Synchronous wrapper around find_arbitrage_opportunities_many
+        
+        Falls back to sequential fetches when aiohttp is not installed.
         
         Args:
-            event: Event data from API
+            sports: List of sport keys
+            regions: List of regions to check
+            markets: List of markets to analyze
             bet_size: Total amount to bet
             
         Returns:
-            List of arbitrage opportunities for this event
+            List of arbitrage opportunities
         """
-        opportunities = []
+        if not AIOHTTP_AVAILABLE:
+            opportunities = []
+            for sport in sports:
+                opportunities.extend(self.find_arbitrage_opportunities(sport, regions, markets, bet_size))
+            return opportunities
+            
+        return asyncio.run(self.find_arbitrage_opportunities_many(sports, regions, markets, bet_size))
+    
+    def _bookmaker_index(self, bookmaker: Dict) -> int:
+        """
+        Get the index of a bookmaker in the shared lookup table, adding it if new
+        
+        Args:
+            bookmaker: Bookmaker data from API
+            
+        Returns:
+            Index into self._bm_keys / self._bm_titles
+        """
+        bookmaker_key = bookmaker['key']
+        bm_i = self._bm_index.get(bookmaker_key)
+        
+        if bm_i is None:
+            bm_i = self._bm_index[bookmaker_key] = len(self._bm_keys)
+            self._bm_keys.append(sys.intern(bookmaker_key))
+            self._bm_titles.append(sys.intern(bookmaker['title']))
+            
+        return bm_i
+    
+    def _collect_candidates(self, event: Dict) -> List[Tuple[List[str], List[float], List[int]]]:
+        """
+        Collect the best odds of every market in an event that may be an arbitrage
         
+        Args:
+            event: Event data from API
+            
+        Returns:
+            List of (outcome names, best odds, bookmaker indices) per candidate market
+        """
         if not event.get('bookmakers'):
-            return opportunities
+            return []
             
-        # Group outcomes by market
-        markets_data = {}
+        # Best odds per (market, outcome) cell, stored as parallel arrays
+        market_index: Dict[str, int] = {}
+        market_outcomes: List[List[str]] = []
+        market_cells: List[List[int]] = []
+        inverse_sums: List[float] = []
+        outcome_index: Dict[Tuple[str, str], int] = {}
+        best_odds: List[float] = []
+        best_bm_idx: List[int] = []
         
         for bookmaker in event['bookmakers']:
-            bookmaker_key = bookmaker['key']
-            bookmaker_title = bookmaker['title']
+            bm_i = self._bookmaker_index(bookmaker)
             
             for market in bookmaker.get('markets', []):
-                market_key = market['key']
+                market_key = sys.intern(market['key'])
+                m = market_index.get(market_key)
                 
-                if market_key not in markets_data:
-                    markets_data[market_key] = {}
+                if m is None:
+                    m = market_index[market_key] = len(market_outcomes)
+                    market_outcomes.append([])
+                    market_cells.append([])
+                    inverse_sums.append(0.0)
                     
                 for outcome in market.get('outcomes', []):
-                    outcome_name = outcome['name']
+                    outcome_name = sys.intern(outcome['name'])
                     price = float(outcome['price'])
+                    key = (market_key, outcome_name)
+                    cell = outcome_index.get(key)
                     
-                    # Keep track of best odds for each outcome
-                    if outcome_name not in markets_data[market_key]:
-                        markets_data[market_key][outcome_name] = {
-                            'best_odds': price,
-                            'bookmaker': bookmaker_title,
-                            'bookmaker_key': bookmaker_key
-                        }
-                    elif price > markets_data[market_key][outcome_name]['best_odds']:
-                        markets_data[market_key][outcome_name] = {
-                            'best_odds': price,
-                            'bookmaker': bookmaker_title,
-                            'bookmaker_key': bookmaker_key
-                        }
-        
-        # Check each market for arbitrage opportunities
-        for market_key, outcomes_data in markets_data.items():
-            if len(outcomes_data) < 2:  # Need at least 2 outcomes
-                continue
+                    # Keep track of best odds for each outcome, and the running
+                    # sum of their inverses so no second pass is needed
+                    if cell is None:
+                        cell = outcome_index[key] = len(best_odds)
+                        market_cells[m].append(cell)
+                        market_outcomes[m].append(outcome_name)
+                        best_odds.append(price)
+                        best_bm_idx.append(bm_i)
+                        inverse_sums[m] += 1.0 / price
+                    elif price > best_odds[cell]:
+                        inverse_sums[m] += 1.0 / price - 1.0 / best_odds[cell]
+                        best_odds[cell] = price
+                        best_bm_idx[cell] = bm_i
+        
+        # Only markets with at least 2 outcomes whose running sum clears the
+        # profit threshold need the exact math; the tolerance absorbs drift
+        # from the incremental updates, calc_batch recomputes from scratch
+        threshold = 1.0 - config.MIN_PROFIT_MARGIN / 100 + _INVERSE_SUM_TOLERANCE
+        
+        candidates = []
+        for names, cells, inverse_sum in zip(market_outcomes, market_cells, inverse_sums):
+            if inverse_sum < threshold and len(cells) >= 2:
+                odds, bm_indices = [], []
+                for cell in cells:
+                    odds.append(best_odds[cell])
+                    bm_indices.append(best_bm_idx[cell])
+                candidates.append((names, odds, bm_indices))
                 
-            # Extract odds and check for arbitrage
-            outcome_names = list(outcomes_data.keys())
-            odds = [outcomes_data[name]['best_odds'] for name in outcome_names]
+        return candidates
+    
+    def _analyze_events(self, events: Iterable[Dict], bet_size: float) -> List[ArbitrageOpportunity]:
+        """
+        Analyze a batch of events for arbitrage opportunities
+        
+        Args:
+            events: Event data from API
+            bet_size: Total amount to bet
+            
+        Returns:
+            List of arbitrage opportunities across all events
+        """
+        rows = []
+        for event in events:
+            rows.extend((event, *candidate) for candidate in self._collect_candidates(event))
+            
+        return self._evaluate_candidates(rows, bet_size)
+    
+    def _evaluate_candidates(self, rows: List[Tuple[Dict, List[str], List[float], List[int]]],
+                             bet_size: float) -> List[ArbitrageOpportunity]:
+        """
+        Run the arbitrage math for candidate markets gathered from many events
+        
+        Candidates are stacked into one odds matrix so the arbitrage math
+        runs in a single calc_batch call.
+        
+        Args:
+            rows: (event, outcome names, best odds, bookmaker indices) per candidate
+            bet_size: Total amount to bet
+            
+        Returns:
+            List of arbitrage opportunities
+        """
+        opportunities = []
+        
+        if not rows:
+            return opportunities
+            
+        # Fill the NaN-padded matrix and evaluate it at once
+        max_outcomes = max(len(odds) for _, _, odds, _ in rows)
+        odds_matrix = np.full((len(rows), max_outcomes), np.nan)
+        
+        for i, (_, _, odds, _) in enumerate(rows):
+            odds_matrix[i, :len(odds)] = odds
             
-            arbitrage_percentage = self.calculator.calculate_arbitrage_percentage(odds)
+        arbitrage_percentages, stakes, profits = self.calculator.calc_batch(odds_matrix, bet_size)
+        
+        for i in np.nonzero(arbitrage_percentages < 1.0)[0]:
+            arbitrage_percentage = float(arbitrage_percentages[i])
+            profit_margin = (1.0 - arbitrage_percentage) * 100
             
-            if arbitrage_percentage < 1.0:  # Arbitrage opportunity found
-                profit_margin = (1.0 - arbitrage_percentage) * 100
+            if profit_margin >= config.MIN_PROFIT_MARGIN:
+                event, outcome_names, odds, bm_indices = rows[i]
                 
-                if profit_margin >= config.MIN_PROFIT_MARGIN:
-                    guaranteed_profit = self.calculator.calculate_guaranteed_profit(odds, bet_size)
-                    stakes = self.calculator.calculate_stakes(odds, bet_size)
-                    
-                    # Create outcome details
-                    outcomes = []
-                    for i, name in enumerate(outcome_names):
-                        outcomes.append({
-                            'name': name,
-                            'odds': odds[i],
-                            'bookmaker': outcomes_data[name]['bookmaker'],
-                            'bookmaker_key': outcomes_data[name]['bookmaker_key'],
-                            'stake': stakes[i]
-                        })
-                    
-                    opportunity = ArbitrageOpportunity(
-                        event_id=event['id'],
-                        sport=event['sport_key'],
-                        home_team=event['home_team'],
-                        away_team=event['away_team'],
-                        commence_time=event['commence_time'],
-                        outcomes=outcomes,
-                        arbitrage_percentage=arbitrage_percentage,
-                        profit_margin=profit_margin,
-                        guaranteed_profit=guaranteed_profit,
-                        total_stake=bet_size
-                    )
-                    
-                    opportunities.append(opportunity)
+                # Create outcome details
+                outcomes = tuple(
+                    Outcome(name, odd, self._bm_titles[bm_i], self._bm_keys[bm_i], stake)
+                    for name, odd, bm_i, stake in zip(outcome_names, odds, bm_indices, stakes[i].tolist())
+                )
+                
+                opportunity = ArbitrageOpportunity(
+                    event_id=event['id'],
+                    sport=event['sport_key'],
+                    home_team=event['home_team'],
+                    away_team=event['away_team'],
+                    commence_time=event['commence_time'],
+                    outcomes=outcomes,
+                    arbitrage_percentage=arbitrage_percentage,
+                    profit_margin=profit_margin,
+                    guaranteed_profit=float(profits[i]),
+                    total_stake=bet_size
+                )
+                
+                opportunities.append(opportunity)
         
         return opportunities
     
+    def _analyze_event(self, event: Dict, bet_size: float) -> List[ArbitrageOpportunity]:
+        """
+        Analyze a single event for arbitrage opportunities
+        
+        Args:
+            event: Event data from API
+            bet_size: Total amount to bet
+            
+        Returns:
+            List of arbitrage opportunities for this event
+        """
+        return self._analyze_events([event], bet_size)
+    
     def display_opportunities(self, opportunities: List[ArbitrageOpportunity]):
         """
         Display arbitrage opportunities in a formatted way
@@ -366,38 +1168,42 @@ class ArbitrageFinder:
             opportunities: List of arbitrage opportunities to display
         """
         if not opportunities:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}📊 No arbitrage opportunities found.{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}📊 No arbitrage opportunities found.{_RESET}")
             return
             
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}🎯 ARBITRAGE OPPORTUNITIES FOUND: {len(opportunities)}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        # Resolve loop-invariant config once
+        sports = config.AVAILABLE_SPORTS
+        odds_fmt = f"{{:.{config.DECIMAL_PLACES}f}}"
+        
+        print(f"\n{_GREEN}🎯 ARBITRAGE OPPORTUNITIES FOUND: {len(opportunities)}{_RESET}")
         print("=" * 80)
         
         for i, opp in enumerate(opportunities, 1):
-            print(f"\n{Fore.CYAN if COLORS_AVAILABLE else ''}📋 OPPORTUNITY #{i}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"\n{_CYAN}📋 OPPORTUNITY #{i}{_RESET}")
             print(f"Event: {opp.home_team} vs {opp.away_team}")
-            print(f"Sport: {config.AVAILABLE_SPORTS.get(opp.sport, opp.sport)}")
-            print(f"Commence Time: {datetime.fromisoformat(opp.commence_time.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S UTC')}")
-            print(f"Arbitrage Margin: {opp.arbitrage_percentage:.{config.DECIMAL_PLACES}f}")
+            print(f"Sport: {sports.get(opp.sport, opp.sport)}")
+            print(f"Commence Time: {_format_commence(opp.commence_time)}")
+            print(f"Arbitrage Margin: {odds_fmt.format(opp.arbitrage_percentage)}")
             print(f"Profit Margin: {opp.profit_margin:.2f}%")
             print(f"Guaranteed Profit: ${opp.guaranteed_profit:.2f}")
             print(f"Total Stake: ${opp.total_stake:.2f}")
             
-            print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}💰 BETTING STRATEGY:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"\n{_YELLOW}💰 BETTING STRATEGY:{_RESET}")
             for outcome in opp.outcomes:
-                print(f"  • Bet ${outcome['stake']:.2f} on {outcome['name']}")
-                print(f"    Odds: {outcome['odds']:.{config.DECIMAL_PLACES}f} at {outcome['bookmaker']}")
+                print(f"  • Bet ${outcome.stake:.2f} on {outcome.name}")
+                print(f"    Odds: {odds_fmt.format(outcome.odds)} at {outcome.bookmaker}")
             
             print("-" * 80)
 
 
 def main():
     """Main function to run the arbitrage finder"""
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}🤖 Sports Betting Arbitrage Bot{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}================================{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+    print(f"{_MAGENTA}🤖 Sports Betting Arbitrage Bot{_RESET}")
+    print(f"{_MAGENTA}================================{_RESET}")
     
     # Check if API key is configured
     if config.API_KEY == 'YOUR_API_KEY_HERE' or not config.API_KEY:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Please configure your API key in config.py or .env file{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_RED}❌ Please configure your API key in config.py or .env file{_RESET}")
         print("You can get an API key from: https://the-odds-api.com/")
         return
     
@@ -405,7 +1211,7 @@ def main():
     finder = ArbitrageFinder(config.API_KEY)
     
     # Display configuration
-    print(f"\n{Fore.BLUE if COLORS_AVAILABLE else ''}⚙️  Configuration:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+    print(f"\n{_BLUE}⚙️  Configuration:{_RESET}")
     print(f"Sport: {config.AVAILABLE_SPORTS.get(config.SPORT, config.SPORT)}")
     print(f"Regions: {', '.join([config.AVAILABLE_REGIONS.get(r, r) for r in config.REGIONS])}")
     print(f"Markets: {', '.join([config.AVAILABLE_MARKETS.get(m, m) for m in config.MARKETS])}")
@@ -426,12 +1232,12 @@ def main():
         
         # Display API usage information
         if finder.client.requests_remaining:
-            print(f"\n{Fore.BLUE if COLORS_AVAILABLE else ''}📊 API Usage: {finder.client.requests_remaining} requests remaining{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"\n{_BLUE}📊 API Usage: {finder.client.requests_remaining} requests remaining{_RESET}")
             
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}⏹️  Bot stopped by user{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"\n{_YELLOW}⏹️  Bot stopped by user{_RESET}")
     except Exception as e:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ An error occurred: {e}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_RED}❌ An error occurred: {e}{_RESET}")
 
 
 if __name__ == "__main__":
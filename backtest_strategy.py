@@ -13,11 +13,26 @@ Date: June 2025
 
 import sys
 import argparse
-from datetime import datetime, timedelta
-from typing import List, Dict
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
 # Import the main arbitrage finder components
-from arbitrage_bot import ArbitrageFinder, ArbitrageOpportunity
+from arbitrage_bot import ArbitrageFinder, ArbitrageOpportunity, AIOHTTP_AVAILABLE, NUMBA_AVAILABLE
 import config
 
 try:
@@ -28,12 +43,269 @@ except ImportError:
     COLORS_AVAILABLE = False
 
 
+class Printer:
+    """Console output with each level's color bound once, at construction"""
+    
+    __slots__ = ('info', 'ok', 'warn', 'err', 'note', 'title')
+    
+    _LEVELS = (('info', 'BLUE'), ('ok', 'GREEN'), ('warn', 'YELLOW'),
+               ('err', 'RED'), ('note', 'CYAN'), ('title', 'MAGENTA'))
+    
+    def __init__(self, colored: bool = COLORS_AVAILABLE):
+        for level, color in self._LEVELS:
+            setattr(self, level, self._colored(getattr(Fore, color)) if colored else print)
+            
+    @staticmethod
+    def _colored(prefix: str):
+        """
+        Build a print function that wraps its text in one color
+        
+        Args:
+            prefix: Colorama color code
+            
+        Returns:
+            Function printing a single string
+        """
+        reset = Style.RESET_ALL
+        
+        def emit(text: str):
+            print(f"{prefix}{text}{reset}")
+            
+        return emit
+
+
+_printer = Printer()
+
+# Relative cache paths are anchored here, so direct runs and manage.py share one cache
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# YYYY-MM-DD with an optional "THH:MM:SS" / " HH:MM:SS" time part and trailing Z
+_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})(?:[T ](\d{1,2}):(\d{1,2}):(\d{1,2})Z?)?')
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+    
+    @njit(cache=True)
+    def _aggregate_day(profits: np.ndarray, margins: np.ndarray) -> Tuple[float, int]:
+        """
+        Sum a day's profits and locate its best margin in one fused pass
+        
+        Args:
+            profits: Guaranteed profit per opportunity
+            margins: Profit margin per opportunity
+            
+        Returns:
+            Tuple of (total profit, index of the best margin or -1 if empty)
+        """
+        total = 0.0
+        best = -1
+        for i in range(profits.shape[0]):
+            total += profits[i]
+            if best < 0 or margins[i] > margins[best]:
+                best = i
+        return total, best
+else:
+    def _aggregate_day(profits: np.ndarray, margins: np.ndarray) -> Tuple[float, int]:
+        """NumPy fallback for the fused aggregation kernel"""
+        return float(profits.sum()), (int(margins.argmax()) if margins.size else -1)
+
+
+# Finder reused by every snapshot analyzed in a worker process
+_worker_finder = None
+
+# On Linux, workers are forked so they inherit the parent's finder, config
+# and imports instead of re-importing them; elsewhere the default applies
+_POOL_CONTEXT = mp.get_context('fork') if sys.platform.startswith('linux') else None
+
+
+def _usable_events(events_data: Optional[List[Dict]]) -> List[Dict]:
+    """
+    Drop events quoted by fewer than two bookmakers
+    
+    Args:
+        events_data: Events from the historical endpoint, or None if the fetch failed
+        
+    Returns:
+        Events worth scanning for arbitrage
+    """
+    return [event for event in events_data or () if len(event.get('bookmakers', ())) >= 2]
+
+
+def _analyze_snapshot(events_data: List[Dict], bet_size: float) -> List[ArbitrageOpportunity]:
+    """
+    Analyze one historical snapshot inside a worker process
+    
+    Args:
+        events_data: Events to scan for arbitrage
+        bet_size: Total amount to bet
+        
+    Returns:
+        List of arbitrage opportunities
+    """
+    return _worker_finder._analyze_events(events_data, bet_size)
+
+
+def _init_worker(finder: Optional[ArbitrageFinder] = None):
+    """
+    Set up the finder used by a snapshot worker process
+    
+    Args:
+        finder: Parent's finder, inherited as-is by forked workers; spawned
+            workers build their own
+    """
+    global _worker_finder
+    _worker_finder = finder if finder is not None else ArbitrageFinder(config.API_KEY)
+
+
+class HistoricalOddsCache:
+    """Memory and on-disk cache of raw historical odds responses"""
+    
+    def __init__(self, path: str = config.HISTORICAL_CACHE_PATH, 
+                 ttl_days: float = config.HISTORICAL_CACHE_TTL_DAYS,
+                 memory_size: int = config.HISTORICAL_CACHE_MEMORY_SIZE):
+        self.path = os.path.join(_MODULE_DIR, path)
+        self.ttl = ttl_days * 86400
+        self.memory_size = memory_size
+        self._memory: OrderedDict = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Open the database on first use
+        
+        A forked worker process opens its own connection rather than
+        sharing the one it inherited from its parent.
+        
+        Returns:
+            Connection owned by the current process
+        """
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path)
+            self._pid = os.getpid()
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS odds (key TEXT PRIMARY KEY, stored_at REAL, payload BLOB)'
+            )
+        return self._conn
+    
+    def _remember(self, key: str, events: List[Dict]):
+        """
+        Keep a decoded response in memory, evicting the least recently used one when full
+        
+        Args:
+            key: Key from make_key
+            events: Decoded events
+        """
+        self._memory[key] = events
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+            
+    @staticmethod
+    def key_prefix(sport: str, regions: Sequence[str], markets: Sequence[str]) -> bytes:
+        """
+        Build the date-independent part of a cache key once per backtest
+        
+        Args:
+            sport: Sport key
+            regions: Regions, in any order
+            markets: Markets, in any order
+            
+        Returns:
+            Encoded (sport, regions, markets) prefix
+        """
+        return json.dumps((sport, sorted(set(regions)), sorted(set(markets)))).encode()
+    
+    @staticmethod
+    def make_key(prefix: bytes, date: str) -> str:
+        """
+        Build the cache key for one historical request
+        
+        Args:
+            prefix: Value from key_prefix
+            date: Date in ISO format
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        return hashlib.blake2b(prefix + date.encode(), digest_size=16).hexdigest()
+    
+    def get(self, key: str, remember: bool = True) -> Optional[List[Dict]]:
+        """
+        Look up a cached response, checking memory before disk
+        
+        Args:
+            key: Key from make_key
+            remember: Whether a response read from disk is kept in memory
+            
+        Returns:
+            Cached events or None if missing or older than the TTL
+        """
+        events = self._memory.get(key)
+        if events is not None:
+            self._memory.move_to_end(key)
+            return events
+            
+        row = self._connection().execute(
+            'SELECT stored_at, payload FROM odds WHERE key = ?', (key,)
+        ).fetchone()
+        
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+            
+        events = json.loads(gzip.decompress(row[1]))
+        if remember:
+            self._remember(key, events)
+        return events
+    
+    def set(self, key: str, events: Optional[List[Dict]], remember: bool = True):
+        """
+        Store a response on disk and in memory; failed fetches are not cached
+        
+        Args:
+            key: Key from make_key
+            events: Events returned by the API, or None if the request failed
+            remember: Whether the response is also kept in memory
+        """
+        if events is None:
+            return
+            
+        if remember:
+            self._remember(key, events)
+        
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO odds (key, stored_at, payload) VALUES (?, ?, ?)',
+                (key, time.time(), gzip.compress(json.dumps(events).encode()))
+            )
+            
+    def close(self):
+        """Close this process's database connection and drop the memory tier"""
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        self._memory.clear()
+
+
 class HistoricalArbitrageFinder(ArbitrageFinder):
     """Extended arbitrage finder for historical data analysis"""
     
+    def __init__(self, api_key: str, use_cache: bool = True, printer: Printer = _printer):
+        super().__init__(api_key)
+        self.printer = printer
+        # Historical snapshots never change, so responses are kept across runs
+        self.cache = HistoricalOddsCache() if use_cache else None
+        
     def find_historical_opportunities(self, sport: str, regions: List[str], 
                                     markets: List[str], bet_size: float, 
-                                    date: str) -> List[ArbitrageOpportunity]:
+                                    date: str, sport_label: Optional[str] = None) -> List[ArbitrageOpportunity]:
         """
         Find arbitrage opportunities for a specific historical date
         
@@ -43,36 +315,98 @@ class HistoricalArbitrageFinder(ArbitrageFinder):
             markets: List of markets to analyze
             bet_size: Total amount to bet
             date: Date in ISO format (YYYY-MM-DDTHH:MM:SSZ)
+            sport_label: Display name of the sport (defaults to the key)
             
         Returns:
             List of arbitrage opportunities
         """
-        print(f"{Fore.BLUE if COLORS_AVAILABLE else ''}🔍 Fetching historical odds data for {config.AVAILABLE_SPORTS.get(sport, sport)} on {date}...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  Note: Historical endpoints consume more API requests!{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        events_data = self._fetch_historical_snapshots(sport, regions, markets, [date], sport_label=sport_label)[date]
         
-        events_data = self.client.get_historical_odds(sport, regions, markets, date)
+        return self._analyze_historical_events(events_data, bet_size)
+    
+    def _analyze_historical_events(self, events_data: Optional[List[Dict]], bet_size: float,
+                                   pending: Optional[Future] = None) -> List[ArbitrageOpportunity]:
+        """
+        Analyze one historical odds snapshot for arbitrage opportunities
         
-        if not events_data:
-            print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Failed to fetch historical odds data{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-            return []
+        Args:
+            events_data: Events from the historical endpoint, or None if the fetch failed
+            bet_size: Total amount to bet
+            pending: Analysis of this snapshot already submitted to a worker process
             
+        Returns:
+            List of arbitrage opportunities
+        """
         if not events_data:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  No historical events found for {sport} on {date}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            self.printer.err("❌ Failed to fetch historical odds data")
             return []
             
-        print(f"{Fore.GREEN if COLORS_AVAILABLE else ''}✅ Found {len(events_data)} historical events{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        self.printer.ok(f"✅ Found {len(events_data)} historical events")
+        
+        if pending is not None:
+            return pending.result()
+        
+        # Events quoted by fewer than two bookmakers are skipped before any
+        # per-outcome work is done
+        return self._analyze_events(_usable_events(events_data), bet_size)
+    
+    def _fetch_historical_snapshots(self, sport: str, regions: List[str], markets: List[str],
+                                    dates: List[str], remember: bool = True,
+                                    sport_label: Optional[str] = None) -> Dict[str, Optional[List[Dict]]]:
+        """
+        Fetch historical odds for every date, concurrently when aiohttp is available
+        
+        Dates already in the cache are served from it; only the rest hit the API.
+        
+        Args:
+            sport: Sport key
+            regions: List of regions to check
+            markets: List of markets to analyze
+            dates: Dates in ISO format
+            remember: Whether snapshots are kept in the cache's memory tier
+            sport_label: Display name of the sport (defaults to the key)
+            
+        Returns:
+            Mapping of date to its events (None where the request failed)
+        """
+        events_by_date = {}
+        keys = {}
+        
+        if self.cache is not None:
+            prefix = HistoricalOddsCache.key_prefix(sport, regions, markets)
+            for date in dates:
+                keys[date] = HistoricalOddsCache.make_key(prefix, date)
+                events = self.cache.get(keys[date], remember)
+                if events is not None:
+                    events_by_date[date] = events
+                    
+            if events_by_date:
+                self.printer.note(f"💾 {len(events_by_date)} of {len(dates)} historical snapshots loaded from cache")
+                
+        missing = [date for date in dates if date not in events_by_date]
+        
+        if not missing:
+            return events_by_date
         
-        opportunities = []
+        self.printer.info(f"🔍 Fetching {len(missing)} historical odds snapshots for {sport_label or sport}...")
+        self.printer.warn("⚠️  Note: Historical endpoints consume more API requests!")
         
-        for event in events_data:
-            event_opportunities = self._analyze_event(event, bet_size)
-            opportunities.extend(event_opportunities)
+        if not AIOHTTP_AVAILABLE:
+            fetched = {date: self.client.get_historical_odds(sport, regions, markets, date) for date in missing}
+        else:
+            fetched = asyncio.run(self.client.get_historical_odds_many(sport, regions, markets, missing))
             
-        return opportunities
+        if self.cache is not None:
+            for date, events in fetched.items():
+                self.cache.set(keys[date], events, remember)
+                
+        events_by_date.update(fetched)
+        return events_by_date
     
     def backtest_date_range(self, sport: str, regions: List[str], markets: List[str], 
                            bet_size: float, start_date: str, end_date: str, 
-                           interval_hours: int = 24) -> Dict:
+                           interval_hours: int = 24, results_path: Optional[str] = None,
+                           sport_label: Optional[str] = None) -> Dict:
         """
         Backtest arbitrage opportunities over a date range
         
@@ -84,12 +418,16 @@ class HistoricalArbitrageFinder(ArbitrageFinder):
             start_date: Start date in ISO format
             end_date: End date in ISO format
             interval_hours: Hours between each check
+            results_path: JSONL file to stream per-date results to instead of
+                keeping them in results['daily_results']; snapshots then also
+                bypass the odds cache's memory tier
+            sport_label: Display name of the sport (defaults to the key)
             
         Returns:
             Dictionary with backtesting results
         """
-        print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}📈 Starting backtesting from {start_date} to {end_date}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}⚠️  WARNING: This will consume many API requests!{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        self.printer.title(f"📈 Starting backtesting from {start_date} to {end_date}")
+        self.printer.err("⚠️  WARNING: This will consume many API requests!")
         
         start_dt = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
         end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
@@ -100,48 +438,115 @@ class HistoricalArbitrageFinder(ArbitrageFinder):
             'dates_checked': 0,
             'dates_with_opportunities': 0,
             'best_opportunity': None,
-            'daily_results': []
+            'daily_results': [],
+            'results_path': results_path
         }
         
-        current_dt = start_dt
+        # Every check time is generated and formatted in one vectorized pass
+        dates = pd.date_range(
+            start_dt, end_dt, freq=pd.Timedelta(hours=interval_hours)
+        ).strftime('%Y-%m-%dT%H:%M:%SZ').tolist()
         
-        while current_dt <= end_dt:
-            date_str = current_dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+        # Snapshots are fetched and analyzed one window of dates at a time, so
+        # at most MAX_CONCURRENCY of them are held at once however long the range
+        window = max(1, config.MAX_CONCURRENCY)
+        remember = results_path is None
+        seen_events = 0
+        pool = None
+        
+        # The worker pool and results file are released however the loop exits
+        with contextlib.ExitStack() as stack:
+            results_file = stack.enter_context(open(results_path, 'w')) if results_path else None
+            
+            # One slot per date up front; trimmed below if any date is skipped
+            daily_results = results['daily_results'] = [None] * (0 if results_file else len(dates))
+            filled = 0
             
-            try:
-                opportunities = self.find_historical_opportunities(
-                    sport, regions, markets, bet_size, date_str
+            for window_start in range(0, len(dates), window):
+                window_dates = dates[window_start:window_start + window]
+                events_by_date = self._fetch_historical_snapshots(
+                    sport, regions, markets, window_dates, remember, sport_label
                 )
+                snapshots = {date_str: _usable_events(events_by_date[date_str]) for date_str in window_dates}
+                seen_events += sum(map(len, snapshots.values()))
                 
-                daily_profit = sum(opp.guaranteed_profit for opp in opportunities)
-                
-                daily_result = {
-                    'date': date_str,
-                    'opportunities_count': len(opportunities),
-                    'total_profit': daily_profit,
-                    'opportunities': opportunities
-                }
-                
-                results['daily_results'].append(daily_result)
-                results['total_opportunities'] += len(opportunities)
-                results['total_profit'] += daily_profit
-                results['dates_checked'] += 1
-                
-                if opportunities:
-                    results['dates_with_opportunities'] += 1
+                # Once a backtest has proven large, the remaining windows spread
+                # snapshot analysis across CPU cores; small ones never pay the
+                # worker start-up cost
+                if pool is None and len(dates) > 1 and seen_events >= config.PARALLEL_MIN_EVENTS:
+                    pool = ProcessPoolExecutor(
+                        mp_context=_POOL_CONTEXT, initializer=_init_worker,
+                        initargs=(self,) if _POOL_CONTEXT is not None else ()
+                    )
+                    stack.callback(pool.shutdown, cancel_futures=True)
                     
-                    # Track best opportunity
-                    best_daily = max(opportunities, key=lambda x: x.profit_margin)
-                    if (results['best_opportunity'] is None or 
-                        best_daily.profit_margin > results['best_opportunity'].profit_margin):
-                        results['best_opportunity'] = best_daily
+                pending = {}
+                if pool is not None:
+                    pending = {date_str: pool.submit(_analyze_snapshot, events, bet_size)
+                               for date_str, events in snapshots.items() if events}
+                del snapshots
                 
-                print(f"{Fore.CYAN if COLORS_AVAILABLE else ''}📅 {date_str}: {len(opportunities)} opportunities, ${daily_profit:.2f} profit{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-                
-            except Exception as e:
-                print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Error processing {date_str}: {e}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+                for date_str in window_dates:
+                    # Each snapshot is dropped from this method's references once analyzed
+                    events = events_by_date.pop(date_str, None)
+                    
+                    # A fetch that still failed after its retries is reported and
+                    # skipped rather than counted as a date without opportunities
+                    if events is None:
+                        self.printer.err(f"❌ Failed to fetch historical odds for {date_str}")
+                        continue
+                        
+                    # Only malformed snapshot data or a failed worker is tolerated per
+                    # date; anything else is a bug and should surface immediately
+                    try:
+                        opportunities = self._analyze_historical_events(
+                            events, bet_size, pending.pop(date_str, None)
+                        )
+                    except (KeyError, TypeError, ValueError, BrokenExecutor) as e:
+                        self.printer.err(f"❌ Error processing {date_str}: {e}")
+                        continue
+                        
+                    # Reduce the day's profits and margins as contiguous arrays
+                    count = len(opportunities)
+                    profits = np.fromiter((opp.guaranteed_profit for opp in opportunities), dtype=np.float64, count=count)
+                    margins = np.fromiter((opp.profit_margin for opp in opportunities), dtype=np.float64, count=count)
+                    daily_profit, best_index = _aggregate_day(profits, margins)
+                    
+                    # Streamed rows keep per-date results out of memory
+                    if results_file is not None:
+                        results_file.write(json.dumps({
+                            'date': date_str,
+                            'opportunities_count': count,
+                            'total_profit': daily_profit
+                        }) + '\n')
+                    else:
+                        daily_results[filled] = {
+                            'date': date_str,
+                            'opportunities_count': count,
+                            'total_profit': daily_profit,
+                            'opportunities': opportunities
+                        }
+                        filled += 1
+                        
+                    results['total_opportunities'] += count
+                    results['total_profit'] += daily_profit
+                    results['dates_checked'] += 1
+                    
+                    if opportunities:
+                        results['dates_with_opportunities'] += 1
+                        
+                        # Track best opportunity
+                        best_daily = opportunities[best_index]
+                        if (results['best_opportunity'] is None or 
+                            best_daily.profit_margin > results['best_opportunity'].profit_margin):
+                            results['best_opportunity'] = best_daily
+                    
+                    self.printer.note(f"📅 {date_str}: {count} opportunities, ${daily_profit:.2f} profit")
+                    
+            del daily_results[filled:]
             
-            current_dt += timedelta(hours=interval_hours)
+        if results_path:
+            self.printer.info(f"💾 Daily results written to {results_path}")
             
         return results
     
@@ -152,7 +557,7 @@ class HistoricalArbitrageFinder(ArbitrageFinder):
         Args:
             results: Backtesting results dictionary
         """
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}📊 BACKTESTING SUMMARY{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        self.printer.ok("\n📊 BACKTESTING SUMMARY")
         print("=" * 50)
         print(f"Dates Checked: {results['dates_checked']}")
         print(f"Dates with Opportunities: {results['dates_with_opportunities']}")
@@ -168,14 +573,34 @@ class HistoricalArbitrageFinder(ArbitrageFinder):
             print(f"Average Profit per Day: ${avg_profit:.2f}")
             print(f"Success Rate: {success_rate:.1f}%")
         
+        # Streamed backtests keep their per-date rows on disk only
+        daily_results = load_backtest(results['results_path']) if results.get('results_path') else results['daily_results']
+        if daily_results:
+            best_day = max(daily_results, key=lambda day: day['total_profit'])
+            print(f"Best Day: {best_day['date']} (${best_day['total_profit']:.2f} profit)")
+            
         if results['best_opportunity']:
             best = results['best_opportunity']
-            print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}🏆 BEST OPPORTUNITY:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            self.printer.warn("\n🏆 BEST OPPORTUNITY:")
             print(f"Event: {best.home_team} vs {best.away_team}")
             print(f"Profit Margin: {best.profit_margin:.2f}%")
             print(f"Guaranteed Profit: ${best.guaranteed_profit:.2f}")
 
 
+def load_backtest(path: str) -> List[Dict]:
+    """
+    Load per-date results streamed by backtest_date_range
+    
+    Args:
+        path: JSONL file passed as results_path
+        
+    Returns:
+        List of daily result dictionaries (without opportunity objects)
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
 def parse_date(date_string: str) -> str:
     """
     Parse and validate date string
@@ -187,25 +612,18 @@ def parse_date(date_string: str) -> str:
         ISO formatted date string
     """
     try:
-        # Try parsing different date formats
-        formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%d %H:%M:%S'
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_string, fmt)
-                return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-            except ValueError:
-                continue
-                
-        raise ValueError("Invalid date format")
+        # One match covers every supported format; only out-of-range
+        # values (e.g. month 13) still raise from the constructor
+        match = _DATE_RE.fullmatch(date_string)
+        
+        if match is None:
+            raise ValueError("Invalid date format")
+            
+        dt = datetime(*(int(part or 0) for part in match.groups()))
+        return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
         
     except ValueError:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Invalid date format: {date_string}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        _printer.err(f"❌ Invalid date format: {date_string}")
         print("Supported formats:")
         print("- YYYY-MM-DD")
         print("- YYYY-MM-DDTHH:MM:SS")
@@ -245,76 +663,90 @@ Examples:
                        help=f'Markets to analyze (default: {config.MARKETS})')
     parser.add_argument('--interval', type=int, default=24,
                        help='Hours between checks for range analysis (default: 24)')
+    parser.add_argument('--results-file', type=str,
+                       help='Stream per-date range results to this JSONL file instead of keeping them in memory')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always fetch from the API instead of the local historical odds cache')
     
     args = parser.parse_args()
     
+    # Normalize once so every request, cache key and label sees the same tuples
+    args.regions = tuple(sorted(set(args.regions)))
+    args.markets = tuple(sorted(set(args.markets)))
+    
     # Validate arguments
     if not args.date and not (args.start_date and args.end_date):
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Please provide either --date or both --start-date and --end-date{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        _printer.err("❌ Please provide either --date or both --start-date and --end-date")
         parser.print_help()
         sys.exit(1)
     
     if args.date and (args.start_date or args.end_date):
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Cannot use --date with --start-date/--end-date{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        _printer.err("❌ Cannot use --date with --start-date/--end-date")
         sys.exit(1)
     
     # Check API key
     if config.API_KEY == 'YOUR_API_KEY_HERE' or not config.API_KEY:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Please configure your API key in config.py or .env file{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        _printer.err("❌ Please configure your API key in config.py or .env file")
         return
     
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}🔬 Historical Arbitrage Backtesting{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}===================================={Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+    _printer.title("🔬 Historical Arbitrage Backtesting")
+    _printer.title("====================================")
     
     # Initialize historical finder
-    finder = HistoricalArbitrageFinder(config.API_KEY)
+    finder = HistoricalArbitrageFinder(config.API_KEY, use_cache=not args.no_cache, printer=_printer)
+    sport_label = config.AVAILABLE_SPORTS.get(args.sport, args.sport)
     
     try:
         if args.date:
             # Single date analysis
             date_iso = parse_date(args.date)
             
-            print(f"\n{Fore.BLUE if COLORS_AVAILABLE else ''}⚙️  Analysis Configuration:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            _printer.info("\n⚙️  Analysis Configuration:")
             print(f"Date: {date_iso}")
-            print(f"Sport: {config.AVAILABLE_SPORTS.get(args.sport, args.sport)}")
+            print(f"Sport: {sport_label}")
             print(f"Bet Size: ${args.bet_size}")
             
             opportunities = finder.find_historical_opportunities(
-                args.sport, args.regions, args.markets, args.bet_size, date_iso
+                args.sport, args.regions, args.markets, args.bet_size, date_iso,
+                sport_label=sport_label
             )
             
             finder.display_opportunities(opportunities)
             
             if opportunities:
                 total_profit = sum(opp.guaranteed_profit for opp in opportunities)
-                print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}💰 Total potential profit on {args.date}: ${total_profit:.2f}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+                _printer.ok(f"\n💰 Total potential profit on {args.date}: ${total_profit:.2f}")
             
         else:
             # Date range analysis
             start_iso = parse_date(args.start_date)
             end_iso = parse_date(args.end_date)
             
-            print(f"\n{Fore.BLUE if COLORS_AVAILABLE else ''}⚙️  Backtesting Configuration:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            _printer.info("\n⚙️  Backtesting Configuration:")
             print(f"Date Range: {start_iso} to {end_iso}")
-            print(f"Sport: {config.AVAILABLE_SPORTS.get(args.sport, args.sport)}")
+            print(f"Sport: {sport_label}")
             print(f"Bet Size: ${args.bet_size}")
             print(f"Check Interval: {args.interval} hours")
             
             results = finder.backtest_date_range(
                 args.sport, args.regions, args.markets, args.bet_size,
-                start_iso, end_iso, args.interval
+                start_iso, end_iso, args.interval, args.results_file,
+                sport_label=sport_label
             )
             
             finder.display_backtest_summary(results)
         
         # Display API usage
         if finder.client.requests_remaining:
-            print(f"\n{Fore.BLUE if COLORS_AVAILABLE else ''}📊 API Usage: {finder.client.requests_remaining} requests remaining{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            _printer.info(f"\n📊 API Usage: {finder.client.requests_remaining} requests remaining")
             
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}⏹️  Backtesting stopped by user{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        _printer.warn("\n⏹️  Backtesting stopped by user")
     except Exception as e:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ An error occurred: {e}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        _printer.err(f"❌ An error occurred: {e}")
+    finally:
+        if finder.cache is not None:
+            finder.cache.close()
 
 
 if __name__ == "__main__":
@@ -19,7 +19,18 @@ BET_SIZE = 100  # Total amount to bet for profit calculation
 # API Request Configuration
 REQUEST_TIMEOUT = 30  # Request timeout in seconds
 MAX_RETRIES = 3  # Maximum number of retries for API requests
-RETRY_DELAY = 5  # Delay between retries in seconds
+RETRY_DELAY = 1  # Base delay between retries in seconds (doubles per attempt, with jitter)
+RETRY_MAX_DELAY = 30  # Upper bound on a single retry delay in seconds
+MAX_CONCURRENCY = 10  # Maximum in-flight requests for concurrent multi-sport fetches
+MAX_RPS = 5  # Client-side request rate limit (requests per second)
+BURST = 10  # Requests allowed back-to-back before MAX_RPS spacing applies
+ODDS_CACHE_TTL = 15  # Seconds an odds response is reused for identical requests
+ODDS_CACHE_SIZE = 128  # Maximum number of cached odds responses
+STREAM_MIN_BYTES = 64 * 1024  # Responses smaller than this are parsed in one go instead of streamed
+HISTORICAL_CACHE_PATH = '.odds_cache.sqlite'  # On-disk cache of historical odds responses
+HISTORICAL_CACHE_TTL_DAYS = 30  # Days a cached historical response is reused
+HISTORICAL_CACHE_MEMORY_SIZE = 4096  # Maximum decoded historical responses kept in memory
+PARALLEL_MIN_EVENTS = 2000  # Backtests with at least this many events analyze snapshots in worker processes
 
 # Display Configuration
 MIN_PROFIT_MARGIN = 0.5  # Minimum profit margin percentage to display
@@ -9,14 +9,17 @@ Author: GitHub Copilot
 Date: June 2025
 """
 
-import random
+import sys
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
-import json
+
+import numpy as np
 
 import config
-from arbitrage_bot import OddsAPIClient
+from arbitrage_bot import OddsAPIClient, NUMBA_AVAILABLE
 
 try:
     from colorama import init, Fore, Style
@@ -25,8 +28,96 @@ try:
 except ImportError:
     COLORS_AVAILABLE = False
 
+if COLORS_AVAILABLE:
+    _RED, _GREEN, _YELLOW = Fore.RED, Fore.GREEN, Fore.YELLOW
+    _BLUE, _MAGENTA, _CYAN = Fore.BLUE, Fore.MAGENTA, Fore.CYAN
+    _RESET = Style.RESET_ALL
+else:
+    _RED = _GREEN = _YELLOW = _BLUE = _MAGENTA = _CYAN = _RESET = ''
+
+
+# Column order of the simulation lookup tables below
+_POSITIONS = ('PG', 'SG', 'SF', 'PF', 'C')
+_POSITION_INDEX = {position: i for i, position in enumerate(_POSITIONS)}
+_STAT_NAMES = ('points', 'rebounds', 'assists', 'steals', 'blocks', 'turnovers', 'three_pointers')
+
+# Base salary and projected stats by position, rows in _POSITIONS order
+_BASE_SALARY = np.array([8500, 7800, 8200, 7900, 8000], dtype=np.float64)
+_BASE_STATS = np.array([
+    [18, 4, 8, 1.2, 0.3, 3.0, 2.5],   # PG
+    [20, 4, 4, 1.0, 0.4, 2.5, 2.8],   # SG
+    [19, 6, 5, 1.1, 0.8, 2.8, 2.2],   # SF
+    [17, 8, 3, 0.8, 1.2, 2.2, 1.5],   # PF
+    [16, 10, 2, 0.6, 1.8, 2.0, 0.8]   # C
+], dtype=np.float64)
+
+# Markets scanned by analyze_real_arbitrage; anything else in the feed is skipped
+_ARBITRAGE_MARKETS = ('h2h', 'totals', 'spreads')
+_ARBITRAGE_MARKET_SET = frozenset(_ARBITRAGE_MARKETS)
+
+# Uniform variates generated per refill of the simulation pool
+_UNIFORM_POOL_SIZE = 4096
+
+_SUPERSTARS = ('LeBron James', 'Stephen Curry', 'Kevin Durant', 'Giannis Antetokounmpo')
+_STARS = ('Luka Doncic', 'Jayson Tatum', 'Joel Embiid', 'Nikola Jokic')
+
+# DraftKings lineup slots: one per position, then the G/F/UTIL flex slots
+_LINEUP_SLOTS = _POSITIONS + ('G', 'F', 'UTIL')
+
+# Slots each position may fill, bit i set for _LINEUP_SLOTS[i]; the lowest
+# open bit is the direct slot first, then the G/F flex, then UTIL
+_SLOT_ELIGIBILITY = np.array([
+    0b10100001,  # PG -> PG, G, UTIL
+    0b10100010,  # SG -> SG, G, UTIL
+    0b11000100,  # SF -> SF, F, UTIL
+    0b11001000,  # PF -> PF, F, UTIL
+    0b10010000   # C  -> C, UTIL
+], dtype=np.uint8)
+
+
+def _greedy_fill(salaries: np.ndarray, positions: np.ndarray, salary_cap: int,
+                 eligibility: np.ndarray = _SLOT_ELIGIBILITY) -> np.ndarray:
+    """
+    Greedily fill the lineup slots from players already sorted by value
+    
+    Args:
+        salaries: Salary per player
+        positions: Index into _POSITIONS per player
+        salary_cap: Maximum total salary
+        eligibility: Slot bitmask per position
+        
+    Returns:
+        Indices of the selected players, in pick order
+    """
+    full_mask = (1 << len(_LINEUP_SLOTS)) - 1
+    picks = np.empty(len(_LINEUP_SLOTS), dtype=np.int64)
+    filled_mask = 0
+    count = 0
+    total_salary = 0
+    
+    for i in range(salaries.shape[0]):
+        if filled_mask == full_mask:  # Max lineup size
+            break
+        if total_salary + salaries[i] > salary_cap:
+            continue
+        
+        # Take the lowest open slot this position is eligible for
+        open_slots = np.int64(eligibility[positions[i]]) & ~filled_mask
+        if open_slots:
+            filled_mask |= open_slots & -open_slots
+            picks[count] = i
+            count += 1
+            total_salary += salaries[i]
+        
+    return picks[:count]
+
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+    _greedy_fill = njit(cache=True)(_greedy_fill)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimulatedPlayer:
     """Simulated DFS player data"""
     name: str
@@ -44,7 +135,7 @@ class SimulatedPlayer:
 class DFSAnalysisTool:
     """Comprehensive DFS analysis tool with demo capabilities"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, seed: Optional[int] = None):
         self.client = OddsAPIClient(api_key)
         
         # NBA teams for simulation
@@ -81,221 +172,237 @@ class DFSAnalysisTool:
             'turnovers': -1.0,
             'three_pointers': 0.5
         }
-    
-    def generate_simulated_slate(self, num_games: int = 6) -> List[SimulatedPlayer]:
-        """Generate a simulated DFS slate with realistic player data"""
         
-        print(f"{Fore.BLUE if COLORS_AVAILABLE else ''}🎮 Generating simulated NBA DFS slate with {num_games} games...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        # Scoring weights aligned with _STAT_NAMES so a slate scores in one matmul
+        self._weights = np.array([self.dfs_scoring[stat] for stat in _STAT_NAMES])
         
-        players = []
-        used_teams = set()
+        # Star-power multiplier by player name; everyone else is 1.0
+        self._star_mult = dict.fromkeys(_SUPERSTARS, 1.3)
+        self._star_mult.update(dict.fromkeys(_STARS, 1.2))
         
-        # Generate games
-        for game_num in range(num_games):
-            # Pick two teams that haven't been used
-            available_teams = [t for t in self.nba_teams if t not in used_teams]
-            if len(available_teams) < 2:
-                break
-                
-            team1, team2 = random.sample(available_teams, 2)
-            used_teams.add(team1)
-            used_teams.add(team2)
-            
-            game_time = (datetime.now() + timedelta(hours=random.randint(2, 8))).strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Generate players for each team
-            for team, opponent in [(team1, team2), (team2, team1)]:
-                team_players = random.sample(self.sample_players, 4)  # 4 players per team in slate
-                
-                for player_name, position in team_players:
-                    # Generate realistic stats and pricing
-                    base_salary = {
-                        'PG': 8500, 'SG': 7800, 'SF': 8200, 'PF': 7900, 'C': 8000
-                    }.get(position, 7500)
-                    
-                    # Add variance based on "star power"
-                    star_multiplier = 1.0
-                    if player_name in ['LeBron James', 'Stephen Curry', 'Kevin Durant', 'Giannis Antetokounmpo']:
-                        star_multiplier = 1.3
-                    elif player_name in ['Luka Doncic', 'Jayson Tatum', 'Joel Embiid', 'Nikola Jokic']:
-                        star_multiplier = 1.2
-                    
-                    salary = int(base_salary * star_multiplier * random.uniform(0.8, 1.2))
-                    salary = min(12000, max(4000, salary))  # Salary range
-                    
-                    # Generate projected stats
-                    stats = self._generate_projected_stats(position, star_multiplier)
-                    
-                    # Calculate DFS points
-                    projected_points = self._calculate_dfs_points(stats)
-                    
-                    # Calculate value score
-                    value_score = projected_points / (salary / 1000)
-                    
-                    # Generate confidence (higher for stars)
-                    confidence = random.uniform(60, 95) * star_multiplier * 0.9
-                    confidence = min(95, confidence)
-                    
-                    player = SimulatedPlayer(
-                        name=player_name,
-                        team=team,
-                        opponent=opponent,
-                        position=position,
-                        salary=salary,
-                        projected_stats=stats,
-                        projected_points=projected_points,
-                        value_score=value_score,
-                        confidence=confidence,
-                        game_time=game_time
-                    )
-                    
-                    players.append(player)
+        # Player pool as parallel columns, fancy-indexed by the sampled rows
+        self._pool_names = np.array([name for name, _ in self.sample_players])
+        self._pool_position_idx = np.array([_POSITION_INDEX[position] for _, position in self.sample_players],
+                                           dtype=np.intp)
+        self._pool_star_mult = np.array([self._star_mult.get(name, 1.0) for name, _ in self.sample_players])
         
-        return players
+        # Single PCG64 generator behind every simulated draw; pass a seed for
+        # reproducible slates
+        self._rng = np.random.default_rng(seed)
+        self._uniform_pool = np.empty(0)
+        self._uniform_pos = 0
+        
+        # Arbitrage scans by (sport, regions, markets) as (monotonic time, opportunities)
+        self._arbitrage_cache: Dict[Tuple, Tuple[float, List[Dict]]] = {}
     
-    def _generate_projected_stats(self, position: str, star_multiplier: float) -> Dict[str, float]:
-        """Generate realistic projected stats for a position"""
-        
-        # Base stats by position
-        base_stats = {
-            'PG': {'points': 18, 'rebounds': 4, 'assists': 8, 'steals': 1.2, 'blocks': 0.3, 'turnovers': 3, 'three_pointers': 2.5},
-            'SG': {'points': 20, 'rebounds': 4, 'assists': 4, 'steals': 1.0, 'blocks': 0.4, 'turnovers': 2.5, 'three_pointers': 2.8},
-            'SF': {'points': 19, 'rebounds': 6, 'assists': 5, 'steals': 1.1, 'blocks': 0.8, 'turnovers': 2.8, 'three_pointers': 2.2},
-            'PF': {'points': 17, 'rebounds': 8, 'assists': 3, 'steals': 0.8, 'blocks': 1.2, 'turnovers': 2.2, 'three_pointers': 1.5},
-            'C': {'points': 16, 'rebounds': 10, 'assists': 2, 'steals': 0.6, 'blocks': 1.8, 'turnovers': 2.0, 'three_pointers': 0.8}
-        }
+    def generate_simulated_slate(self, num_games: int = 6) -> List[SimulatedPlayer]:
+        """Generate a simulated DFS slate with realistic player data"""
         
-        stats = base_stats.get(position, base_stats['SF']).copy()
+        print(f"{_BLUE}🎮 Generating simulated NBA DFS slate with {num_games} games...{_RESET}")
         
-        # Apply star multiplier and variance
-        for stat in stats:
-            stats[stat] *= star_multiplier * random.uniform(0.7, 1.3)
-            stats[stat] = round(stats[stat], 1)
+        rng = self._rng
         
-        return stats
-    
-    def _calculate_dfs_points(self, stats: Dict[str, float]) -> float:
-        """Calculate DFS points from projected stats"""
+        # Shuffle once and pair off consecutive teams, so no team plays twice
+        order = rng.permutation(len(self.nba_teams))[:2 * num_games].tolist()
+        shuffled_teams = [self.nba_teams[i] for i in order]
+        start_hours = rng.integers(2, 9, size=len(shuffled_teams) // 2).tolist()
+        now = datetime.now()
         
-        total_points = 0
-        for stat, value in stats.items():
-            multiplier = self.dfs_scoring.get(stat, 0)
-            total_points += value * multiplier
+        # One (team, opponent, game_time) entry per team in the slate
+        matchups = []
         
-        return round(total_points, 2)
+        # Generate games
+        for team1, team2, hours in zip(shuffled_teams[0::2], shuffled_teams[1::2], start_hours):
+            game_time = (now + timedelta(hours=hours)).strftime('%Y-%m-%d %H:%M:%S')
+            matchups.append((team1, team2, game_time))
+            matchups.append((team2, team1, game_time))
+        
+        # Draw 4 distinct players per team in one call: the first 4 columns of a
+        # row-wise argsort of uniform keys are a sample without replacement
+        picks = self._uniform(0.0, 1.0, (len(matchups), len(self.sample_players))).argsort(axis=1)[:, :4]
+        
+        # Per-player columns; every random draw below is done for the whole slate at once
+        flat_picks = picks.ravel()
+        names = self._pool_names[flat_picks].tolist()
+        position_idx = self._pool_position_idx[flat_picks]
+        positions = [_POSITIONS[i] for i in position_idx.tolist()]
+        teams = [team for team, _, _ in matchups for _ in range(4)]
+        opponents = [opponent for _, opponent, _ in matchups for _ in range(4)]
+        game_times = [game_time for _, _, game_time in matchups for _ in range(4)]
+        n = len(names)
+        
+        # Add variance based on "star power"
+        star_mult = self._pool_star_mult[flat_picks]
+        
+        # Generate realistic pricing within the salary range
+        salary = (_BASE_SALARY[position_idx] * star_mult * self._uniform(0.8, 1.2, n)).astype(np.int64)
+        salary = np.clip(salary, 4000, 12000)
+        
+        # Generate projected stats and DFS points
+        stats, projected_points = self._make_stats_and_points(position_idx, star_mult)
+        stats_dicts = [dict(zip(_STAT_NAMES, row)) for row in stats.tolist()]
+        
+        # Calculate value score
+        value_score = projected_points / (salary / 1000)
+        
+        # Generate confidence (higher for stars)
+        confidence = np.minimum(95, self._uniform(60, 95, n) * star_mult * 0.9)
+        
+        return [
+            SimulatedPlayer(
+                name=name,
+                team=team,
+                opponent=opponent,
+                position=position,
+                salary=sal,
+                projected_stats=player_stats,
+                projected_points=points,
+                value_score=value,
+                confidence=conf,
+                game_time=game_time
+            )
+            for name, team, opponent, position, sal, player_stats, points, value, conf, game_time in zip(
+                names, teams, opponents, positions, salary.tolist(), stats_dicts,
+                projected_points.tolist(), value_score.tolist(), confidence.tolist(), game_times
+            )
+        ]
+    
+    def _uniform(self, low: float, high: float, size) -> np.ndarray:
+        """
+        Take uniform variates from the pre-generated pool, refilling it when exhausted
+        
+        Args:
+            low: Lower bound of the draw
+            high: Upper bound of the draw
+            size: Output shape
+            
+        Returns:
+            Array of the given shape with values in [low, high)
+        """
+        count = int(np.prod(size))
+        start = self._uniform_pos
+        if start + count > len(self._uniform_pool):
+            self._uniform_pool = self._rng.random(max(_UNIFORM_POOL_SIZE, count))
+            start = 0
+        self._uniform_pos = start + count
+        return low + (high - low) * self._uniform_pool[start:start + count].reshape(size)
+    
+    def _make_stats_and_points(self, position_idx: np.ndarray,
+                               star_mult: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate realistic projected stats for a batch of players and score them
+        
+        Args:
+            position_idx: Index into _POSITIONS per player
+            star_mult: Star-power multiplier per player
+            
+        Returns:
+            Tuple of (projected stats, one row per player in _STAT_NAMES order,
+            DFS points per player)
+        """
+        # Apply star multiplier and variance in place on the gathered base rows
+        stats = _BASE_STATS[position_idx]
+        stats *= star_mult[:, None]
+        stats *= self._uniform(0.7, 1.3, stats.shape)
+        np.round(stats, 1, out=stats)
+        return stats, np.round(stats @ self._weights, 2)
     
     def analyze_real_arbitrage(self, sport: str = 'basketball_nba') -> List[Dict]:
         """Analyze real arbitrage opportunities from available markets"""
         
-        print(f"{Fore.BLUE if COLORS_AVAILABLE else ''}🔍 Checking for real arbitrage opportunities...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_BLUE}🔍 Checking for real arbitrage opportunities...{_RESET}")
         
         # Try basic markets first
-        basic_markets = ['h2h', 'totals', 'spreads']
         regions = ['us']
         
-        events_data = self.client.get_odds(sport, regions, basic_markets)
+        # Reuse a recent scan for as long as the client would reuse its odds response
+        cache_key = (sport, tuple(regions), _ARBITRAGE_MARKETS)
+        cached = self._arbitrage_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] <= config.ODDS_CACHE_TTL:
+            return list(cached[1])
+        
+        # The client decodes the feed with orjson when available, so prices arrive as numbers
+        events_data = self.client.get_odds(sport, regions, list(_ARBITRAGE_MARKETS))
         
         if not events_data:
             return []
         
-        arbitrage_opportunities = []
+        # Markets quoted with at least two outcomes, and their best prices laid
+        # end to end so the whole feed is checked in one vectorized pass
+        candidates = []
+        prices = []
         
         for event in events_data:
             if not event.get('bookmakers'):
                 continue
             
-            # Analyze each market
-            markets_data = {}
+            # Best (price, bookmaker) per outcome of each market
+            best_prices = defaultdict(dict)
             
             for bookmaker in event['bookmakers']:
+                bookmaker_title = bookmaker['title']
                 for market in bookmaker.get('markets', []):
                     market_key = market['key']
-                    
-                    if market_key not in markets_data:
-                        markets_data[market_key] = {}
+                    if market_key not in _ARBITRAGE_MARKET_SET:
+                        continue
+                    market_best = best_prices[market_key]
                     
                     for outcome in market.get('outcomes', []):
                         outcome_name = outcome['name']
-                        price = float(outcome['price'])
+                        price = outcome['price']
                         
-                        if outcome_name not in markets_data[market_key]:
-                            markets_data[market_key][outcome_name] = {
-                                'best_odds': price,
-                                'bookmaker': bookmaker['title']
-                            }
-                        elif price > markets_data[market_key][outcome_name]['best_odds']:
-                            markets_data[market_key][outcome_name] = {
-                                'best_odds': price,
-                                'bookmaker': bookmaker['title']
-                            }
+                        current = market_best.get(outcome_name)
+                        if current is None or price > current[0]:
+                            market_best[outcome_name] = (price, bookmaker_title)
             
-            # Check for arbitrage in each market
-            for market_key, outcomes in markets_data.items():
-                if len(outcomes) >= 2:
-                    odds_list = [data['best_odds'] for data in outcomes.values()]
-                    arbitrage_pct = sum(1/odd for odd in odds_list)
-                    
-                    if arbitrage_pct < 1.0:
-                        arbitrage_opportunities.append({
-                            'event': f"{event['home_team']} vs {event['away_team']}",
-                            'market': market_key,
-                            'arbitrage_percentage': arbitrage_pct,
-                            'profit_margin': (1 - arbitrage_pct) * 100,
-                            'outcomes': outcomes
-                        })
-        
-        return arbitrage_opportunities
+            for market_key, market_best in best_prices.items():
+                if len(market_best) >= 2:
+                    candidates.append((event, market_key, market_best, len(prices)))
+                    prices.extend(price for price, _ in market_best.values())
+        
+        if not candidates:
+            self._arbitrage_cache[cache_key] = (time.monotonic(), [])
+            return []
+        
+        # Check for arbitrage in each market: sum of 1/odds per segment
+        starts = np.fromiter((start for _, _, _, start in candidates), dtype=np.intp, count=len(candidates))
+        arbitrage_pcts = np.add.reduceat(np.reciprocal(np.array(prices, dtype=np.float64)), starts)
+        
+        arbitrage_opportunities = []
+        for i in np.flatnonzero(arbitrage_pcts < 1.0).tolist():
+            event, market_key, market_best, _ = candidates[i]
+            arbitrage_pct = float(arbitrage_pcts[i])
+            arbitrage_opportunities.append({
+                'event': f"{event['home_team']} vs {event['away_team']}",
+                'market': market_key,
+                'arbitrage_percentage': arbitrage_pct,
+                'profit_margin': (1 - arbitrage_pct) * 100,
+                'outcomes': {
+                    outcome_name: {'best_odds': price, 'bookmaker': title}
+                    for outcome_name, (price, title) in market_best.items()
+                }
+            })
+        
+        self._arbitrage_cache[cache_key] = (time.monotonic(), arbitrage_opportunities)
+        return list(arbitrage_opportunities)
     
     def create_optimal_lineup(self, players: List[SimulatedPlayer], salary_cap: int = 50000) -> Dict:
         """Create an optimal DFS lineup using simulated players"""
         
-        print(f"{Fore.BLUE if COLORS_AVAILABLE else ''}🧮 Creating optimal lineup (salary cap: ${salary_cap:,})...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_BLUE}🧮 Creating optimal lineup (salary cap: ${salary_cap:,})...{_RESET}")
         
         # Simple greedy algorithm for lineup optimization
-        # Sort by value score
-        sorted_players = sorted(players, key=lambda x: x.value_score, reverse=True)
-        
-        # Position requirements (DraftKings format)
-        position_requirements = {
-            'PG': 1, 'SG': 1, 'SF': 1, 'PF': 1, 'C': 1,
-            'G': 1, 'F': 1, 'UTIL': 1  # Flex positions
-        }
-        
-        lineup = []
-        total_salary = 0
-        position_filled = {pos: 0 for pos in position_requirements}
-        
-        for player in sorted_players:
-            if len(lineup) >= 8:  # Max lineup size
-                break
-            
-            if total_salary + player.salary > salary_cap:
-                continue
-            
-            # Check if we can add this player
-            pos = player.position
-            can_add = False
-            
-            # Direct position match
-            if position_filled[pos] < position_requirements.get(pos, 0):
-                position_filled[pos] += 1
-                can_add = True
-            # Flex guard
-            elif pos in ['PG', 'SG'] and position_filled['G'] < position_requirements['G']:
-                position_filled['G'] += 1
-                can_add = True
-            # Flex forward  
-            elif pos in ['SF', 'PF'] and position_filled['F'] < position_requirements['F']:
-                position_filled['F'] += 1
-                can_add = True
-            # Utility
-            elif position_filled['UTIL'] < position_requirements['UTIL']:
-                position_filled['UTIL'] += 1
-                can_add = True
-            
-            if can_add:
-                lineup.append(player)
-                total_salary += player.salary
+        # Sort by value score (stable, so ties keep slate order)
+        values = np.fromiter((p.value_score for p in players), dtype=np.float64, count=len(players))
+        order = np.argsort(-values, kind='stable')
+        salaries = np.fromiter((players[i].salary for i in order.tolist()), dtype=np.int64, count=len(players))
+        positions = np.fromiter((_POSITION_INDEX[players[i].position] for i in order.tolist()),
+                                dtype=np.int8, count=len(players))
+        
+        # Fill PG/SG/SF/PF/C, then G/F/UTIL flex slots (DraftKings format)
+        picks = _greedy_fill(salaries, positions, salary_cap)
+        lineup = [players[i] for i in order[picks].tolist()]
+        total_salary = int(salaries[picks].sum())
         
         if len(lineup) == 8:
             total_projected = sum(p.projected_points for p in lineup)
@@ -314,74 +421,89 @@ class DFSAnalysisTool:
     def display_dfs_analysis(self, players: List[SimulatedPlayer], top_n: int = 15):
         """Display DFS analysis results"""
         
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}💎 TOP DFS VALUE PLAYERS{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print("=" * 100)
+        lines = [f"\n{_GREEN}💎 TOP DFS VALUE PLAYERS{_RESET}", "=" * 100]
+        
+        # Partition out the top_n by value score, then sort only those
+        values = np.fromiter((p.value_score for p in players), dtype=np.float64, count=len(players))
+        top_idx = np.argpartition(-values, top_n)[:top_n] if top_n < len(values) else np.arange(len(values))
+        top_idx = top_idx[np.argsort(-values[top_idx], kind='stable')]
+        top_players = [players[i] for i in top_idx.tolist()]
         
-        # Sort by value score
-        top_players = sorted(players, key=lambda x: x.value_score, reverse=True)[:top_n]
+        # Key projected stats shown per player, with their display labels
+        key_stats = [(stat, stat.title()) for stat in ('points', 'rebounds', 'assists')]
+        append = lines.append
         
         for i, player in enumerate(top_players, 1):
-            print(f"\n{Fore.CYAN if COLORS_AVAILABLE else ''}🏀 #{i:2d} {player.name} ({player.position}){Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-            print(f"     {player.team} vs {player.opponent}")
-            print(f"     Salary: ${player.salary:,}  |  Projected: {player.projected_points:.1f}pts  |  Value: {player.value_score:.2f}")
-            print(f"     Confidence: {player.confidence:.0f}%")
+            name, position, team, opponent = player.name, player.position, player.team, player.opponent
+            salary, points, value, confidence = (player.salary, player.projected_points,
+                                                 player.value_score, player.confidence)
+            projected_stats = player.projected_stats
+            
+            append(f"\n{_CYAN}🏀 #{i:2d} {name} ({position}){_RESET}")
+            append(f"     {team} vs {opponent}")
+            append(f"     Salary: ${salary:,}  |  Projected: {points:.1f}pts  |  Value: {value:.2f}")
+            append(f"     Confidence: {confidence:.0f}%")
             
             # Show key projected stats
-            key_stats = ['points', 'rebounds', 'assists']
-            stats_str = " | ".join([f"{stat.title()}: {player.projected_stats.get(stat, 0):.1f}" 
-                                   for stat in key_stats])
-            print(f"     {stats_str}")
+            stats_str = " | ".join([f"{label}: {projected_stats.get(stat, 0):.1f}" for stat, label in key_stats])
+            append(f"     {stats_str}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_optimal_lineup(self, lineup_data: Dict):
         """Display the optimal lineup"""
         
         if not lineup_data:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  Could not create optimal lineup{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}⚠️  Could not create optimal lineup{_RESET}")
             return
         
         lineup = lineup_data['lineup']
         
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}🏆 OPTIMAL DFS LINEUP{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print("=" * 80)
-        print(f"Total Salary: ${lineup_data['total_salary']:,} (${lineup_data['remaining_salary']:,} remaining)")
-        print(f"Projected Points: {lineup_data['projected_points']:.1f}")
-        print(f"Value Score: {lineup_data['value_score']:.2f}")
+        lines = [f"\n{_GREEN}🏆 OPTIMAL DFS LINEUP{_RESET}", "=" * 80]
+        lines.append(f"Total Salary: ${lineup_data['total_salary']:,} (${lineup_data['remaining_salary']:,} remaining)")
+        lines.append(f"Projected Points: {lineup_data['projected_points']:.1f}")
+        lines.append(f"Value Score: {lineup_data['value_score']:.2f}")
         
-        print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}👥 ROSTER:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        lines.append(f"\n{_YELLOW}👥 ROSTER:{_RESET}")
         
+        append = lines.append
         for i, player in enumerate(lineup, 1):
-            print(f"{i}. {player.position:<3} {player.name:<20} ${player.salary:>5,} "
-                  f"{player.projected_points:>5.1f}pts ({player.value_score:.2f}val)")
+            position, name, salary = player.position, player.name, player.salary
+            points, value = player.projected_points, player.value_score
+            append(f"{i}. {position:<3} {name:<20} ${salary:>5,} {points:>5.1f}pts ({value:.2f}val)")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_arbitrage_opportunities(self, opportunities: List[Dict]):
         """Display real arbitrage opportunities"""
         
         if not opportunities:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}📊 No arbitrage opportunities found in current markets.{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}📊 No arbitrage opportunities found in current markets.{_RESET}")
             return
         
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}🎯 LIVE ARBITRAGE OPPORTUNITIES: {len(opportunities)}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print("=" * 80)
+        lines = [f"\n{_GREEN}🎯 LIVE ARBITRAGE OPPORTUNITIES: {len(opportunities)}{_RESET}", "=" * 80]
         
         for i, opp in enumerate(opportunities, 1):
-            print(f"\n{Fore.CYAN if COLORS_AVAILABLE else ''}📋 OPPORTUNITY #{i}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-            print(f"Event: {opp['event']}")
-            print(f"Market: {opp['market'].upper()}")
-            print(f"Profit Margin: {opp['profit_margin']:.2f}%")
+            lines.append(f"\n{_CYAN}📋 OPPORTUNITY #{i}{_RESET}")
+            lines.append(f"Event: {opp['event']}")
+            lines.append(f"Market: {opp['market'].upper()}")
+            lines.append(f"Profit Margin: {opp['profit_margin']:.2f}%")
             
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}Betting Strategy:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            lines.append(f"{_YELLOW}Betting Strategy:{_RESET}")
             for outcome_name, data in opp['outcomes'].items():
-                print(f"  • {outcome_name}: {data['best_odds']:.2f} at {data['bookmaker']}")
+                lines.append(f"  • {outcome_name}: {data['best_odds']:.2f} at {data['bookmaker']}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Main function for DFS analysis tool"""
     
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}💎 DFS Analysis & Demo Tool{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}============================={Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+    print(f"{_MAGENTA}💎 DFS Analysis & Demo Tool{_RESET}")
+    print(f"{_MAGENTA}============================={_RESET}")
     
     if config.API_KEY == 'YOUR_API_KEY_HERE' or not config.API_KEY:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Please configure your API key{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_RED}❌ Please configure your API key{_RESET}")
         return
     
     tool = DFSAnalysisTool(config.API_KEY)
@@ -403,13 +525,13 @@ def main():
         
         # API usage info
         if tool.client.requests_remaining:
-            print(f"\n{Fore.BLUE if COLORS_AVAILABLE else ''}📊 API Usage: {tool.client.requests_remaining} requests remaining{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"\n{_BLUE}📊 API Usage: {tool.client.requests_remaining} requests remaining{_RESET}")
         
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}✨ Analysis complete! This demo shows DFS value analysis with simulated player data{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print(f"{Fore.GREEN if COLORS_AVAILABLE else ''}   plus real arbitrage opportunities from live betting markets.{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"\n{_GREEN}✨ Analysis complete! This demo shows DFS value analysis with simulated player data{_RESET}")
+        print(f"{_GREEN}   plus real arbitrage opportunities from live betting markets.{_RESET}")
         
     except Exception as e:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Error: {e}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_RED}❌ Error: {e}{_RESET}")
 
 
 if __name__ == "__main__":
@@ -9,10 +9,16 @@ Author: GitHub Copilot
 Date: June 2025
 """
 
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
-import itertools
+from typing import List, Dict, Tuple, Optional, Sequence
+from dataclasses import dataclass, field
+import math
+import sys
+from operator import attrgetter
+
+import numpy as np
+
 from dfs_props_analyzer import DFSPlayerValue
+from arbitrage_bot import NUMBA_AVAILABLE
 
 try:
     from colorama import init, Fore, Style
@@ -21,8 +27,130 @@ try:
 except ImportError:
     COLORS_AVAILABLE = False
 
+if COLORS_AVAILABLE:
+    _RED, _GREEN, _YELLOW = Fore.RED, Fore.GREEN, Fore.YELLOW
+    _BLUE, _MAGENTA, _CYAN = Fore.BLUE, Fore.MAGENTA, Fore.CYAN
+    _RESET = Style.RESET_ALL
+else:
+    _RED = _GREEN = _YELLOW = _BLUE = _MAGENTA = _CYAN = _RESET = ''
+
+try:
+    import pulp
+    PULP_AVAILABLE = True
+except ImportError:
+    PULP_AVAILABLE = False
+
+
+# DraftKings NBA CSV columns, and the columns each position may fill in fill order
+_CSV_SLOTS = ('PG', 'SG', 'SF', 'PF', 'C', 'G', 'F', 'UTIL')
+_CSV_SLOT_CHOICES = {
+    'PG': (0, 5, 7), 'SG': (1, 5, 7), 'SF': (2, 6, 7), 'PF': (3, 6, 7), 'C': (4, 7),
+    'G': (5, 7), 'F': (6, 7), 'UTIL': (7,)
+}
+
+# Lineup display blocks: header per lineup, one row per player, then a footer
+_LINEUP_HEADER_FMT = (
+    "\n{cyan}💼 LINEUP #{number} - {lineup_type}{reset}\n"
+    "Total Salary: ${total_salary:,} / ${salary_cap:,}\n"
+    "Projected Points: {projected_points:.2f}\n"
+    "Value Score: {value_score:.2f}\n"
+    "Risk Score: {risk_score:.0f}/100 (lower is safer)\n"
+    "\n{yellow}👥 ROSTER:{reset}\n"
+)
+_ROSTER_ROW_FMT = "  {:<4} {:<20} ${:>5,} {:>5.1f}pts {:>4.2f}val\n"
+_LINEUP_FOOTER = "-" * 100 + "\n"
+
+# Share of roster spots two lineups may have in common before one counts as a duplicate
+_DUPLICATE_OVERLAP = 0.75
+
+# Write buffer for lineup CSV exports
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def _slot_masks(requirements: Dict, eligible_slots: Dict[str, Tuple[str, ...]]) -> Dict[str, int]:
+    """
+    Map each position to a bitmask of the roster slots it may fill
+    
+    Slots are expanded one bit per required player in requirements order, so
+    the lowest open bit is the first slot with spare capacity.
+    
+    Args:
+        requirements: Roster requirements for the sport
+        eligible_slots: Slots each player position may fill
+        
+    Returns:
+        Dict of position -> slot bitmask
+    """
+    slot_list = [slot for slot, required_count in requirements['positions'].items()
+                 for _ in range(required_count)]
+    return {
+        position: sum(1 << bit for bit, slot in enumerate(slot_list) if slot in slots)
+        for position, slots in eligible_slots.items()
+    }
+
+
+def _greedy_fill(order: np.ndarray, salaries: np.ndarray, eligibility: np.ndarray,
+                 salary_cap: int, roster_size: int) -> np.ndarray:
+    """
+    Greedily fill roster slots walking players in composite-score order
+    
+    Args:
+        order: Pool indices sorted by composite score, best first
+        salaries: Salary per pool player
+        eligibility: Slot bitmask per pool player
+        salary_cap: Maximum total salary
+        roster_size: Number of roster slots
+        
+    Returns:
+        Pool indices of the selected players, in pick order
+    """
+    picks = np.empty(roster_size, dtype=np.int64)
+    filled_mask = 0
+    count = 0
+    total_salary = 0
+    
+    for k in range(order.shape[0]):
+        if count >= roster_size:
+            break
+        
+        i = order[k]
+        if total_salary + salaries[i] > salary_cap:
+            continue
+        
+        # Take the first slot with spare capacity this player is eligible for
+        open_slots = eligibility[i] & ~filled_mask
+        if open_slots:
+            filled_mask |= open_slots & -open_slots
+            picks[count] = i
+            count += 1
+            total_salary += salaries[i]
+            
+    return picks[:count]
+
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+    _greedy_fill = njit(cache=True)(_greedy_fill)
+
+
+def _top_ranked(composite: np.ndarray, k: int) -> np.ndarray:
+    """
+    Rank the k best composite scores without sorting the whole pool
+    
+    Args:
+        composite: Composite score per pool player
+        k: Number of players to rank
+        
+    Returns:
+        Pool indices of the top k players, best first (ties in pool order)
+    """
+    if k >= len(composite):
+        return np.argsort(-composite, kind='stable')
+    top = np.sort(np.argpartition(-composite, k)[:k])
+    return top[np.argsort(-composite[top], kind='stable')]
+
 
-@dataclass 
+@dataclass(slots=True)
 class DFSLineup:
     """Represents a DFS lineup"""
     players: List[DFSPlayerValue]
@@ -31,6 +159,45 @@ class DFSLineup:
     value_score: float
     risk_score: float
     lineup_type: str  # 'cash', 'gpp', 'balanced'
+    # Bit i set for player i of the pool the lineup was built from; only
+    # comparable between lineups from the same optimize_lineups call
+    player_mask: int = field(default=0, repr=False, compare=False)
+
+
+@dataclass(slots=True)
+class _PlayerPool:
+    """Viable players plus their numeric fields as parallel arrays"""
+    players: List[DFSPlayerValue]
+    salaries: np.ndarray
+    value_scores: np.ndarray
+    projected_points: np.ndarray
+    ceilings: np.ndarray  # Projected points normalized to the value-score scale
+    confidences: np.ndarray
+    eligibility: np.ndarray  # Roster-slot bitmask per player
+
+
+def _player_pool(players: List[DFSPlayerValue], masks: Dict[str, int]) -> _PlayerPool:
+    """
+    Lay out a player list as parallel arrays once so each lineup type scores it in a vector op
+    
+    Args:
+        players: Viable players
+        masks: Roster-slot bitmask per position
+        
+    Returns:
+        Player pool
+    """
+    n = len(players)
+    projected_points = np.fromiter((p.projected_points for p in players), dtype=np.float64, count=n)
+    return _PlayerPool(
+        players=players,
+        salaries=np.fromiter((p.salary for p in players), dtype=np.int64, count=n),
+        value_scores=np.fromiter((p.value_score for p in players), dtype=np.float64, count=n),
+        projected_points=projected_points,
+        ceilings=projected_points / 10,
+        confidences=np.fromiter((p.confidence_score for p in players), dtype=np.float64, count=n),
+        eligibility=np.fromiter((masks[p.position] for p in players), dtype=np.int64, count=n)
+    )
 
 
 class DFSLineupOptimizer:
@@ -66,6 +233,56 @@ class DFSLineupOptimizer:
                 'total_players': 9
             }
         }
+        
+        # Roster slots each position may fill: natural slot first, then flex, then UTIL
+        self._eligibility = {
+            'PG': ('PG', 'G', 'UTIL'),
+            'SG': ('SG', 'G', 'UTIL'),
+            'SF': ('SF', 'F', 'UTIL'),
+            'PF': ('PF', 'F', 'UTIL'),
+            'C': ('C', 'UTIL'),
+            'QB': ('QB',), 'RB': ('RB',), 'WR': ('WR',), 'TE': ('TE',), 'K': ('K',), 'DEF': ('DEF',)
+        }
+        
+        # Slot bitmasks per sport, resolved once here so building a pool is a dict lookup per player
+        self._sport_slot_masks = {
+            sport: _slot_masks(requirements, self._eligible_slots(self._eligibility))
+            for sport, requirements in self.roster_requirements.items()
+        }
+    
+    def _eligible_slots(self, positions) -> Dict[str, Tuple[str, ...]]:
+        """
+        Look up the roster slots for a set of positions
+        
+        Args:
+            positions: Player positions to cover
+            
+        Returns:
+            Dict of position -> eligible slots; UTIL takes any position, and
+            positions missing from the table may also fill their own slot
+        """
+        eligible = {}
+        for position in positions:
+            slots = self._eligibility.get(position, (position,))
+            eligible[position] = slots if 'UTIL' in slots else slots + ('UTIL',)
+        return eligible
+    
+    def _position_masks(self, sport: str, players: List[DFSPlayerValue]) -> Dict[str, int]:
+        """
+        Get the slot bitmask for every position in a player list
+        
+        Args:
+            sport: Sport key
+            players: Players to cover
+            
+        Returns:
+            Dict of position -> slot bitmask
+        """
+        masks = self._sport_slot_masks[sport]
+        missing = {p.position for p in players if p.position not in masks}
+        if missing:
+            masks = {**masks, **_slot_masks(self.roster_requirements[sport], self._eligible_slots(missing))}
+        return masks
     
     def optimize_lineups(self, players: List[DFSPlayerValue], sport: str, 
                         lineup_count: int = 5) -> List[DFSLineup]:
@@ -81,22 +298,23 @@ class DFSLineupOptimizer:
             List of optimized lineups
         """
         if sport not in self.roster_requirements:
-            print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Sport {sport} not supported for lineup optimization{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_RED}❌ Sport {sport} not supported for lineup optimization{_RESET}")
             return []
         
         requirements = self.roster_requirements[sport]
         salary_cap = requirements['salary_cap']
         
-        print(f"{Fore.BLUE if COLORS_AVAILABLE else ''}🔧 Optimizing {lineup_count} lineups for {sport}...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_BLUE}🔧 Optimizing {lineup_count} lineups for {sport}...{_RESET}")
         print(f"Salary Cap: ${salary_cap:,}")
         
         # Filter players by minimum value threshold
         viable_players = [p for p in players if p.value_score >= 2.0]
         
         if len(viable_players) < requirements['total_players']:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  Not enough viable players for lineup optimization{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}⚠️  Not enough viable players for lineup optimization{_RESET}")
             return []
         
+        pool = _player_pool(viable_players, self._position_masks(sport, viable_players))
         lineups = []
         
         # Generate different lineup types
@@ -107,10 +325,18 @@ class DFSLineupOptimizer:
         ]
         
         for lineup_type, value_weight, ceiling_weight in lineup_types:
-            for i in range(lineup_count // len(lineup_types) + 1):
+            # Score and rank the pool once per lineup type; every attempt reuses them
+            composite = value_weight * pool.value_scores + ceiling_weight * pool.ceilings
+            order = None if PULP_AVAILABLE else _top_ranked(composite, 3 * requirements['total_players'])
+            
+            # The greedy fill is deterministic, so only the ILP (whose diversity
+            # cuts change each solve) gains anything from repeated attempts
+            attempts = lineup_count // len(lineup_types) + 1 if PULP_AVAILABLE else 1
+            
+            for i in range(attempts):
                 lineup = self._generate_lineup(
-                    viable_players, requirements, salary_cap,
-                    lineup_type, value_weight, ceiling_weight
+                    pool, composite, order, requirements, salary_cap,
+                    lineup_type, lineups
                 )
                 
                 if lineup and not self._is_duplicate_lineup(lineup, lineups):
@@ -127,60 +353,136 @@ class DFSLineupOptimizer:
         
         return lineups[:lineup_count]
     
-    def _generate_lineup(self, players: List[DFSPlayerValue], requirements: Dict,
-                        salary_cap: int, lineup_type: str, value_weight: float,
-                        ceiling_weight: float) -> DFSLineup:
-        """Generate a single lineup using greedy optimization"""
-        
-        # Score players based on lineup type  
-        scored_players = []
-        for player in players:
-            value_score = player.value_score
-            ceiling_score = player.projected_points / 10  # Normalize ceiling
-            
-            composite_score = (value_weight * value_score + 
-                             ceiling_weight * ceiling_score)
-            
-            scored_players.append((composite_score, player))
+    def _generate_lineup(self, pool: _PlayerPool, composite: np.ndarray, order: Optional[np.ndarray],
+                        requirements: Dict, salary_cap: int, lineup_type: str,
+                        previous_lineups: Sequence[DFSLineup] = ()) -> Optional[DFSLineup]:
+        """
+        Generate a single lineup, solving it as an integer program when PuLP is available
         
-        # Sort by composite score
-        scored_players.sort(key=lambda x: x[0], reverse=True)
+        Args:
+            pool: Viable players and their numeric fields
+            composite: Composite score per player for this lineup type
+            order: Shortlist of pool indices sorted by composite score, best
+                first, for the greedy fallback
+            requirements: Roster requirements for the sport
+            salary_cap: Maximum total salary
+            lineup_type: 'cash', 'gpp' or 'balanced'
+            previous_lineups: Lineups this one must not duplicate (ILP only)
+            
+        Returns:
+            Lineup, or None if no valid roster fits under the cap
+        """
+        if PULP_AVAILABLE:
+            picks = self._solve_lineup(pool, composite, requirements, salary_cap, previous_lineups)
+            return self._build_lineup(pool, picks, requirements, lineup_type)
         
         # Greedy selection with position constraints
-        selected_players = []
-        total_salary = 0
-        position_counts = {pos: 0 for pos in requirements['positions']}
+        picks = _greedy_fill(order, pool.salaries, pool.eligibility, salary_cap,
+                             requirements['total_players'])
         
-        for score, player in scored_players:
-            if len(selected_players) >= requirements['total_players']:
-                break
-                
-            if total_salary + player.salary > salary_cap:
-                continue
+        # The shortlist ran out before the roster filled; walk the full ranking instead
+        if len(picks) < requirements['total_players'] and len(order) < len(composite):
+            picks = _greedy_fill(_top_ranked(composite, len(composite)), pool.salaries,
+                                 pool.eligibility, salary_cap, requirements['total_players'])
+        picks = picks.tolist()
+        
+        return self._build_lineup(pool, picks, requirements, lineup_type)
+    
+    def _solve_lineup(self, pool: _PlayerPool, composite: np.ndarray, requirements: Dict,
+                      salary_cap: int, previous_lineups: Sequence[DFSLineup]) -> List[int]:
+        """
+        Pick the roster maximizing the composite score with a binary integer program
+        
+        Each variable assigns one player to one roster slot the player is eligible for, so
+        the G/F/UTIL flex slots are filled exactly rather than greedily.
+        
+        Args:
+            pool: Viable players and their numeric fields
+            composite: Composite score per player
+            requirements: Roster requirements for the sport
+            salary_cap: Maximum total salary
+            previous_lineups: Lineups to stay different from
             
-            # Check position requirements
-            player_pos = player.position
-            can_add = False
+        Returns:
+            Pool indices of the selected players in roster-slot order, or an empty list if infeasible
+        """
+        slots = requirements['positions']
+        scores = composite.tolist()
+        salaries = pool.salaries.tolist()
+        problem = pulp.LpProblem('dfs_lineup', pulp.LpMaximize)
+        
+        # Slots as integer ids, and each position's eligible slot ids for this roster
+        slot_names = list(slots)
+        slot_index = {slot: k for k, slot in enumerate(slot_names)}
+        slot_ids = {
+            position: tuple(slot_index[slot] for slot in eligible if slot in slot_index)
+            for position, eligible in self._eligible_slots({p.position for p in pool.players}).items()
+        }
+        
+        # One binary variable per (player, eligible slot), grouped both ways as they are created
+        by_slot = [[] for _ in slot_names]
+        by_player = []
+        objective = []
+        salary_terms = []
+        for i, player in enumerate(pool.players):
+            player_vars = []
+            for k in slot_ids[player.position]:
+                var = pulp.LpVariable(f'x_{i}_{slot_names[k]}', cat='Binary')
+                by_slot[k].append((i, var))
+                player_vars.append(var)
+                objective.append(scores[i] * var)
+                salary_terms.append(salaries[i] * var)
+            by_player.append(player_vars)
+        
+        problem += pulp.lpSum(objective)
+        
+        # Every slot filled to its required count, each player used at most once
+        for k, required_count in enumerate(slots.values()):
+            problem += pulp.lpSum(var for _, var in by_slot[k]) == required_count
+        for player_vars in by_player:
+            if player_vars:
+                problem += pulp.lpSum(player_vars) <= 1
+        
+        problem += pulp.lpSum(salary_terms) <= salary_cap
+        
+        # Diversity cuts: share fewer players with each earlier lineup than would count as a duplicate
+        max_overlap = math.ceil(requirements['total_players'] * _DUPLICATE_OVERLAP) - 1
+        for lineup in previous_lineups:
+            mask = lineup.player_mask
+            problem += pulp.lpSum(var for i, player_vars in enumerate(by_player) if mask >> i & 1
+                                  for var in player_vars) <= max_overlap
+        
+        problem.solve(pulp.PULP_CBC_CMD(msg=0))
+        if problem.status != pulp.LpStatusOptimal:
+            return []
+        
+        return [i for slot_vars in by_slot for i, var in slot_vars if var.varValue > 0.5]
+    
+    def _build_lineup(self, pool: _PlayerPool, picks: List[int], requirements: Dict,
+                      lineup_type: str) -> Optional[DFSLineup]:
+        """
+        Wrap a selected roster in a DFSLineup if it is complete
+        
+        Args:
+            pool: Player pool the roster was picked from
+            picks: Pool indices of the players picked for the lineup
+            requirements: Roster requirements for the sport
+            lineup_type: 'cash', 'gpp' or 'balanced'
             
-            # Check if player can fill required position
-            for pos, required_count in requirements['positions'].items():
-                if position_counts[pos] < required_count:
-                    if (pos == player_pos or 
-                        (pos == 'G' and player_pos in ['PG', 'SG']) or
-                        (pos == 'F' and player_pos in ['SF', 'PF']) or
-                        pos == 'UTIL'):
-                        position_counts[pos] += 1
-                        can_add = True
-                        break
+        Returns:
+            Lineup, or None if the roster is incomplete
+        """
+        if len(picks) == requirements['total_players']:
+            # Lineup totals are reductions over the pool arrays; player objects
+            # are only looked up for the roster itself
+            idx = np.asarray(picks, dtype=np.intp)
+            total_salary = int(pool.salaries[idx].sum())
+            projected_points = float(pool.projected_points[idx].sum())
+            total_confidence = float(pool.confidences[idx].sum())
+            selected_players = [pool.players[i] for i in picks]
             
-            if can_add:
-                selected_players.append(player)
-                total_salary += player.salary
-        
-        if len(selected_players) == requirements['total_players']:
-            projected_points = sum(p.projected_points for p in selected_players)
             value_score = projected_points / (total_salary / 1000)
-            risk_score = self._calculate_risk_score(selected_players)
+            risk_score = self._calculate_risk_score(total_confidence, len(selected_players))
             
             return DFSLineup(
                 players=selected_players,
@@ -188,18 +490,28 @@ class DFSLineupOptimizer:
                 projected_points=projected_points,
                 value_score=value_score,
                 risk_score=risk_score,
-                lineup_type=lineup_type
+                lineup_type=lineup_type,
+                player_mask=sum(1 << i for i in picks)
             )
         
         return None
     
-    def _calculate_risk_score(self, players: List[DFSPlayerValue]) -> float:
-        """Calculate risk score for a lineup (0-100, lower is safer)"""
-        if not players:
+    def _calculate_risk_score(self, total_confidence: float, player_count: int) -> float:
+        """
+        Calculate risk score for a lineup (0-100, lower is safer)
+        
+        Args:
+            total_confidence: Sum of the players' confidence scores
+            player_count: Number of players in the lineup
+            
+        Returns:
+            Risk score
+        """
+        if not player_count:
             return 50.0
         
         # Base risk on confidence scores
-        avg_confidence = sum(p.confidence_score for p in players) / len(players)
+        avg_confidence = total_confidence / player_count
         risk_score = 100 - avg_confidence
         
         return max(0, min(100, risk_score))
@@ -209,76 +521,104 @@ class DFSLineupOptimizer:
         if not existing_lineups:
             return False
         
+        # Consider duplicate if 75% or more players are the same
+        threshold = len(new_lineup.players) * _DUPLICATE_OVERLAP
+        
+        # Lineups from the same pool compare as bitmasks: one AND and popcount per pair
+        new_mask = new_lineup.player_mask
+        if new_mask:
+            return any((new_mask & existing.player_mask).bit_count() >= threshold
+                       for existing in existing_lineups)
+        
         new_player_names = set(p.player_name for p in new_lineup.players)
+        threshold = math.ceil(len(new_player_names) * _DUPLICATE_OVERLAP)
+        if not threshold:
+            return True
         
         for existing in existing_lineups:
             existing_player_names = set(p.player_name for p in existing.players)
             
-            # Consider duplicate if 75% or more players are the same
-            overlap = len(new_player_names & existing_player_names)
-            if overlap >= len(new_player_names) * 0.75:
-                return True
+            # Count shared players, stopping once the threshold is reached or out of reach
+            overlap = 0
+            remaining = len(new_player_names)
+            for name in new_player_names:
+                remaining -= 1
+                if name in existing_player_names:
+                    overlap += 1
+                    if overlap >= threshold:
+                        return True
+                elif overlap + remaining < threshold:
+                    break
         
         return False
     
-    def display_lineups(self, lineups: List[DFSLineup]):
-        """Display optimized lineups"""
+    def display_lineups(self, lineups: List[DFSLineup], limit: Optional[int] = None, stream=None):
+        """
+        Display optimized lineups
+        
+        Args:
+            lineups: Lineups to display
+            limit: Show at most this many lineups (all if None)
+            stream: Text stream to write to (defaults to sys.stdout)
+        """
+        stream = stream or sys.stdout
+        
         if not lineups:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}📊 No optimized lineups generated.{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}📊 No optimized lineups generated.{_RESET}", file=stream)
             return
         
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}🏆 OPTIMIZED DFS LINEUPS: {len(lineups)}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print("=" * 100)
+        print(f"\n{_GREEN}🏆 OPTIMIZED DFS LINEUPS: {len(lineups)}{_RESET}", file=stream)
+        print("=" * 100, file=stream)
         
-        for i, lineup in enumerate(lineups, 1):
-            print(f"\n{Fore.CYAN if COLORS_AVAILABLE else ''}💼 LINEUP #{i} - {lineup.lineup_type.upper()}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-            print(f"Total Salary: ${lineup.total_salary:,} / ${50000:,}")
-            print(f"Projected Points: {lineup.projected_points:.2f}")
-            print(f"Value Score: {lineup.value_score:.2f}")
-            print(f"Risk Score: {lineup.risk_score:.0f}/100 (lower is safer)")
-            
-            print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}👥 ROSTER:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        row_format = _ROSTER_ROW_FMT.format
+        by_position = attrgetter('position')
+        
+        for i, lineup in enumerate(lineups[:limit], 1):
+            header = _LINEUP_HEADER_FMT.format(
+                cyan=_CYAN, yellow=_YELLOW, reset=_RESET, number=i,
+                lineup_type=lineup.lineup_type.upper(), total_salary=lineup.total_salary,
+                salary_cap=50000, projected_points=lineup.projected_points,
+                value_score=lineup.value_score, risk_score=lineup.risk_score
+            )
             
             # Sort players by position for display
-            sorted_players = sorted(lineup.players, key=lambda x: x.position)
-            
-            for player in sorted_players:
-                print(f"  {player.position:<4} {player.player_name:<20} ${player.salary:>5,} "
-                      f"{player.projected_points:>5.1f}pts {player.value_score:>4.2f}val")
+            sorted_players = sorted(lineup.players, key=by_position)
+            roster = ''.join(row_format(p.position, p.player_name, p.salary, p.projected_points, p.value_score)
+                             for p in sorted_players)
             
-            print("-" * 100)
+            stream.write(header + roster + _LINEUP_FOOTER)
+        
+        if limit is not None and len(lineups) > limit:
+            print(f"... {len(lineups) - limit} more lineups not shown", file=stream)
     
     def export_lineup_csv(self, lineups: List[DFSLineup], filename: str = 'dfs_lineups.csv'):
         """Export lineups to CSV format for DFS sites"""
         try:
             import csv
             
-            with open(filename, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
+            # Map players to positions (simplified): direct slot, then G/F flex, then UTIL
+            rows = []
+            for lineup in lineups:
+                row = [''] * len(_CSV_SLOTS)
+                for player in lineup.players:
+                    for slot in _CSV_SLOT_CHOICES[player.position]:
+                        if not row[slot]:
+                            row[slot] = player.player_name
+                            break
+                rows.append(row)
+            
+            # One large block buffer so thousands of rows go out in a handful of writes
+            with open(filename, 'w', newline='', buffering=_CSV_BUFFER_SIZE,
+                      encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile, lineterminator='\n')
                 
                 # Header row (DraftKings format)
-                writer.writerow(['PG', 'SG', 'SF', 'PF', 'C', 'G', 'F', 'UTIL'])
-                
-                for lineup in lineups:
-                    # Map players to positions (simplified)
-                    position_map = {'PG': '', 'SG': '', 'SF': '', 'PF': '', 'C': '', 'G': '', 'F': '', 'UTIL': ''}
-                    
-                    for player in lineup.players:
-                        if not position_map[player.position]:
-                            position_map[player.position] = player.player_name
-                        elif player.position in ['PG', 'SG'] and not position_map['G']:
-                            position_map['G'] = player.player_name
-                        elif player.position in ['SF', 'PF'] and not position_map['F']:
-                            position_map['F'] = player.player_name
-                        elif not position_map['UTIL']:
-                            position_map['UTIL'] = player.player_name
-                    
-                    writer.writerow(list(position_map.values()))
+                writer.writerows([_CSV_SLOTS, *rows])
             
-            print(f"{Fore.GREEN if COLORS_AVAILABLE else ''}✅ Lineups exported to {filename}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_GREEN}✅ Lineups exported to {filename}{_RESET}")
             
         except Exception as e:
-            print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Failed to export lineups: {e}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_RED}❌ Failed to export lineups: {e}{_RESET}")
 
 
 def main():
@@ -286,11 +626,11 @@ def main():
     from dfs_props_analyzer import DFSPlayerPropsAnalyzer
     import config
     
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}🏆 DFS Lineup Optimizer{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}====================={Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+    print(f"{_MAGENTA}🏆 DFS Lineup Optimizer{_RESET}")
+    print(f"{_MAGENTA}====================={_RESET}")
     
     if config.API_KEY == 'YOUR_API_KEY_HERE' or not config.API_KEY:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Please configure your API key{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_RED}❌ Please configure your API key{_RESET}")
         return
     
     # Get player analysis
@@ -299,28 +639,34 @@ def main():
     regions = ['us']
     
     try:
-        print(f"{Fore.BLUE if COLORS_AVAILABLE else ''}🔍 Getting player analysis...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_BLUE}🔍 Getting player analysis...{_RESET}")
         dfs_values = analyzer.analyze_dfs_value(sport, regions)
         
         if not dfs_values:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  No player data available for optimization{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}⚠️  No player data available for optimization{_RESET}")
             return
         
         # Optimize lineups
         optimizer = DFSLineupOptimizer()
         lineups = optimizer.optimize_lineups(dfs_values, sport, lineup_count=3)
         
+        # Without a terminal (piped or scheduled runs) skip rendering and export straight away
+        if not sys.stdout.isatty():
+            if lineups:
+                optimizer.export_lineup_csv(lineups)
+            return
+        
         # Display results
-        optimizer.display_lineups(lineups)
+        optimizer.display_lineups(lineups, limit=10)
         
         # Export option
         if lineups:
-            export_choice = input(f"\n{Fore.CYAN if COLORS_AVAILABLE else ''}Export lineups to CSV? (y/n): {Style.RESET_ALL if COLORS_AVAILABLE else ''}").lower()
+            export_choice = input(f"\n{_CYAN}Export lineups to CSV? (y/n): {_RESET}").lower()
             if export_choice == 'y':
                 optimizer.export_lineup_csv(lineups)
         
     except Exception as e:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Error: {e}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_RED}❌ Error: {e}{_RESET}")
 
 
 if __name__ == "__main__":
@@ -10,9 +10,10 @@ Author: GitHub Copilot
 Date: June 2025
 """
 
-import requests
-import json
-from datetime import datetime, timedelta
+import asyncio
+import sys
+import time
+import zlib
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import numpy as np
@@ -20,7 +21,7 @@ import pandas as pd
 
 # Import configuration and existing components
 import config
-from arbitrage_bot import OddsAPIClient
+from arbitrage_bot import OddsAPIClient, AIOHTTP_AVAILABLE, NUMBA_AVAILABLE
 
 try:
     from colorama import init, Fore, Style
@@ -29,8 +30,60 @@ try:
 except ImportError:
     COLORS_AVAILABLE = False
 
+if COLORS_AVAILABLE:
+    _RED, _GREEN, _YELLOW = Fore.RED, Fore.GREEN, Fore.YELLOW
+    _BLUE, _MAGENTA, _CYAN = Fore.BLUE, Fore.MAGENTA, Fore.CYAN
+    _RESET = Style.RESET_ALL
+else:
+    _RED = _GREEN = _YELLOW = _BLUE = _MAGENTA = _CYAN = _RESET = ''
 
-@dataclass
+
+# Player prop markets requested from the odds API
+_PLAYER_MARKETS = [
+    'player_points', 'player_rebounds', 'player_assists',
+    'player_threes', 'player_blocks', 'player_steals',
+    'player_turnovers', 'player_points_rebounds_assists'
+]
+
+# Prop markets that feed DFS projections: scoring stat and its fallback multiplier
+_MARKET_STATS = {
+    'player_points': ('points', 1.0),
+    'player_rebounds': ('rebounds', 1.2),
+    'player_assists': ('assists', 1.5),
+    'player_threes': ('three_pointers', 0.5),
+}
+_DEFAULT_MARKET_MULTIPLIERS = {market: default for market, (_, default) in _MARKET_STATS.items()}
+
+
+def _prop_arbitrage_kernel(over_odds: np.ndarray, under_odds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Arbitrage percentage and profit margin for paired best over/under odds
+    
+    Args:
+        over_odds: Best over odds per player market
+        under_odds: Best under odds per player market
+        
+    Returns:
+        Tuple of (arbitrage percentage, profit margin percentage) per market
+    """
+    n_markets = over_odds.shape[0]
+    arbitrage_pct = np.empty(n_markets)
+    profit_margin = np.empty(n_markets)
+    
+    for m in range(n_markets):
+        pct = 1.0 / over_odds[m] + 1.0 / under_odds[m]
+        arbitrage_pct[m] = pct
+        profit_margin[m] = (1.0 - pct) * 100.0
+        
+    return arbitrage_pct, profit_margin
+
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+    _prop_arbitrage_kernel = njit(cache=True)(_prop_arbitrage_kernel)
+
+
+@dataclass(slots=True, frozen=True)
 class PlayerProp:
     """Data class representing a player prop bet"""
     player_name: str
@@ -45,7 +98,7 @@ class PlayerProp:
     game_time: str
     
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DFSPlayerValue:
     """Data class representing DFS player value analysis"""
     player_name: str
@@ -91,8 +144,19 @@ class DFSPlayerPropsAnalyzer:
             }
         }
         
-        # Simulated DFS salaries (in real implementation, these would come from DFS sites)
+        # Per-sport prop market -> DFS points multiplier, resolved once from the scoring tables
+        self._market_multipliers = {
+            sport: {market: scoring.get(stat, default) for market, (stat, default) in _MARKET_STATS.items()}
+            for sport, scoring in self.dfs_scoring.items()
+        }
+        
+        # Simulated DFS salaries and positions per (player, sport), filled on first lookup
+        # (in real implementation, these would come from DFS sites)
         self.player_salaries = {}
+        self._position_cache = {}
+        
+        # Parsed props by (sport, regions) as (monotonic time, props)
+        self._props_cache: Dict[Tuple, Tuple[float, List[PlayerProp]]] = {}
         
     def get_player_props(self, sport: str, regions: List[str]) -> List[PlayerProp]:
         """
@@ -105,23 +169,87 @@ class DFSPlayerPropsAnalyzer:
         Returns:
             List of player prop bets
         """
-        print(f"{Fore.BLUE if COLORS_AVAILABLE else ''}🔍 Fetching player props for {config.AVAILABLE_SPORTS.get(sport, sport)}...{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_BLUE}🔍 Fetching player props for {config.AVAILABLE_SPORTS.get(sport, sport)}...{_RESET}")
         
-        # Get player props markets
-        player_markets = [
-            'player_points', 'player_rebounds', 'player_assists',
-            'player_threes', 'player_blocks', 'player_steals',
-            'player_turnovers', 'player_points_rebounds_assists'
-        ]
+        # Reuse a recent parse for as long as the client would reuse its odds response
+        cache_key = (sport, tuple(regions))
+        cached = self._props_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] <= config.ODDS_CACHE_TTL:
+            return list(cached[1])
         
-        events_data = self.client.get_odds(sport, regions, player_markets)
+        events_data = self.client.get_odds(sport, regions, _PLAYER_MARKETS)
         
         if not events_data:
-            print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Failed to fetch player props data{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_RED}❌ Failed to fetch player props data{_RESET}")
             return []
         
+        player_props = self._parse_player_props(events_data, sport)
+        self._props_cache[cache_key] = (time.monotonic(), player_props)
+        return list(player_props)
+    
+    def get_player_props_for_sports(self, sports: List[str], regions: List[str]) -> List[PlayerProp]:
+        """
+        Fetch player prop odds for several sports, requesting them concurrently
+        
+        Falls back to sequential fetches when aiohttp is not installed.
+        
+        Args:
+            sports: List of sport keys
+            regions: List of regions to check
+            
+        Returns:
+            List of player prop bets across all sports
+        """
+        if not AIOHTTP_AVAILABLE:
+            player_props = []
+            for sport in sports:
+                player_props.extend(self.get_player_props(sport, regions))
+            return player_props
+        
+        print(f"{_BLUE}🔍 Fetching player props for {len(sports)} sports...{_RESET}")
+        
+        # Only sports without a recent parse go out, all in one concurrent batch
+        now = time.monotonic()
+        props_by_sport = {}
+        for sport in sports:
+            cached = self._props_cache.get((sport, tuple(regions)))
+            if cached is not None and now - cached[0] <= config.ODDS_CACHE_TTL:
+                props_by_sport[sport] = cached[1]
+        
+        missing = [sport for sport in sports if sport not in props_by_sport]
+        if missing:
+            odds_by_sport = asyncio.run(self.client.get_odds_many(missing, regions, _PLAYER_MARKETS))
+            
+            for sport, events_data in odds_by_sport.items():
+                if not events_data:
+                    print(f"{_RED}❌ Failed to fetch player props for {config.AVAILABLE_SPORTS.get(sport, sport)}{_RESET}")
+                    continue
+                
+                props_by_sport[sport] = self._parse_player_props(events_data, sport)
+                self._props_cache[(sport, tuple(regions))] = (time.monotonic(), props_by_sport[sport])
+        
+        player_props = []
+        for sport in sports:
+            player_props.extend(props_by_sport.get(sport, []))
+        return player_props
+    
+    def _parse_player_props(self, events_data: List[Dict], sport: str) -> List[PlayerProp]:
+        """
+        Parse player prop bets out of an odds API response
+        
+        Args:
+            events_data: Events with player prop markets
+            sport: Sport key the events belong to
+            
+        Returns:
+            List of player prop bets
+        """
         player_props = []
         
+        # The same outcome names repeat across bookmakers; parse each distinct one once.
+        # Maps outcome name -> (player name, is over) or None when it is not a points outcome
+        parsed_outcomes = {}
+        
         for event in events_data:
             if not event.get('bookmakers'):
                 continue
@@ -140,42 +268,55 @@ class DFSPlayerPropsAnalyzer:
                         continue
                     
                     for outcome in market.get('outcomes', []):
-                        # Parse player name from outcome
-                        if 'name' in outcome and 'point' in outcome.get('name', '').lower():
-                            player_name = self._extract_player_name(outcome['name'])
-                            
-                            # Determine which team the player is on (simplified)
-                            team = home_team if len(player_name) > 0 else away_team
-                            opponent = away_team if team == home_team else home_team
-                            
-                            # Get over/under odds
-                            over_odds = None
-                            under_odds = None
-                            line = outcome.get('point', 0)
-                            
-                            if outcome['name'].lower().startswith('over'):
-                                over_odds = float(outcome['price'])
-                            else:
-                                under_odds = float(outcome['price'])
-                            
-                            # Create player prop
-                            prop = PlayerProp(
-                                player_name=player_name,
-                                team=team,
-                                opponent=opponent,
-                                sport=sport,
-                                market=market_key,
-                                line=line,
-                                over_odds=over_odds or 2.0,
-                                under_odds=under_odds or 2.0,
-                                bookmaker=bookmaker_name,
-                                game_time=game_time
-                            )
-                            
-                            player_props.append(prop)
+                        outcome_name = outcome.get('name')
+                        if outcome_name is None:
+                            continue
+                        
+                        parsed = parsed_outcomes.get(outcome_name, False)
+                        if parsed is False:
+                            parsed = parsed_outcomes[outcome_name] = self._parse_outcome_name(outcome_name)
+                        if parsed is None:
+                            continue
+                        player_name, is_over = parsed
+                        
+                        # Determine which team the player is on (simplified)
+                        team = home_team if len(player_name) > 0 else away_team
+                        opponent = away_team if team == home_team else home_team
+                        
+                        # The price goes to the quoted side; the other side stays at even money
+                        price = float(outcome['price']) or 2.0
+                        
+                        player_props.append(PlayerProp(
+                            player_name=player_name,
+                            team=team,
+                            opponent=opponent,
+                            sport=sport,
+                            market=market_key,
+                            line=outcome.get('point', 0),
+                            over_odds=price if is_over else 2.0,
+                            under_odds=2.0 if is_over else price,
+                            bookmaker=bookmaker_name,
+                            game_time=game_time
+                        ))
         
         return player_props
     
+    def _parse_outcome_name(self, outcome_name: str) -> Optional[Tuple[str, bool]]:
+        """
+        Parse a player prop outcome name
+        
+        Args:
+            outcome_name: Outcome name as quoted by the bookmaker
+            
+        Returns:
+            Tuple of (player name, whether it is the over side), or None if
+            the outcome does not quote a points line
+        """
+        lowered = outcome_name.lower()
+        if 'point' not in lowered:
+            return None
+        return self._extract_player_name(outcome_name), lowered.startswith('over')
+    
     def _extract_player_name(self, outcome_name: str) -> str:
         """Extract player name from outcome string"""
         # This is a simplified extraction - in real implementation,
@@ -187,127 +328,111 @@ class DFSPlayerPropsAnalyzer:
     
     def _simulate_player_salary(self, player_name: str, sport: str) -> int:
         """Simulate DFS salary for a player"""
+        salary = self.player_salaries.get((player_name, sport))
+        if salary is not None:
+            return salary
+        
         # In real implementation, this would fetch from DFS sites
         base_salary = {
             'basketball_nba': 8000,
             'americanfootball_nfl': 7000
         }.get(sport, 6000)
         
-        # Add some variance based on player name hash
-        variance = hash(player_name) % 3000
-        return base_salary + variance
+        # Add some variance based on a stable hash of the player name
+        variance = zlib.crc32(player_name.encode()) % 3000
+        salary = self.player_salaries[(player_name, sport)] = base_salary + variance
+        return salary
     
-    def _calculate_projected_points(self, player_props: List[PlayerProp]) -> float:
+    def _prop_points(self, player_props: List[PlayerProp]) -> np.ndarray:
         """
-        Calculate projected DFS points based on player props
+        Calculate the DFS points each prop line projects
         
         Args:
-            player_props: List of props for a player
+            player_props: List of player props
             
         Returns:
-            Projected DFS points
+            Line times the sport's scoring multiplier, per prop (zero for
+            markets without a DFS stat)
         """
-        if not player_props:
-            return 0.0
-            
-        sport = player_props[0].sport
-        scoring = self.dfs_scoring.get(sport, {})
-        
-        projected_points = 0.0
-        
-        for prop in player_props:
-            # Convert prop line to expected value
-            if prop.market == 'player_points':
-                expected_value = prop.line
-                points_multiplier = scoring.get('points', 1.0)
-            elif prop.market == 'player_rebounds':
-                expected_value = prop.line
-                points_multiplier = scoring.get('rebounds', 1.2)
-            elif prop.market == 'player_assists':
-                expected_value = prop.line
-                points_multiplier = scoring.get('assists', 1.5)
-            elif prop.market == 'player_threes':
-                expected_value = prop.line
-                points_multiplier = scoring.get('three_pointers', 0.5)
-            else:
-                continue
-                
-            projected_points += expected_value * points_multiplier
-        
-        return projected_points
+        count = len(player_props)
+        lines = np.fromiter((prop.line for prop in player_props), dtype=np.float64, count=count)
+        weights = np.fromiter(
+            (self._market_multipliers.get(prop.sport, _DEFAULT_MARKET_MULTIPLIERS).get(prop.market, 0.0)
+             for prop in player_props),
+            dtype=np.float64, count=count)
+        return lines * weights
     
-    def analyze_dfs_value(self, sport: str, regions: List[str]) -> List[DFSPlayerValue]:
+    def analyze_dfs_value(self, sport: str, regions: List[str],
+                          top_n: Optional[int] = None) -> List[DFSPlayerValue]:
         """
         Analyze DFS value opportunities for players
         
         Args:
             sport: Sport key
             regions: List of regions to check
+            top_n: Only build analyses for this many best-value players (all if None)
             
         Returns:
-            List of DFS player value analyses
+            List of DFS player value analyses, best value first
         """
         player_props = self.get_player_props(sport, regions)
         
         if not player_props:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}⚠️  No player props found for {sport}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}⚠️  No player props found for {sport}{_RESET}")
             return []
         
-        print(f"{Fore.GREEN if COLORS_AVAILABLE else ''}✅ Found {len(player_props)} player props{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        
-        # Group props by player
-        players_props = {}
-        for prop in player_props:
-            player_key = f"{prop.player_name}_{prop.team}"
-            if player_key not in players_props:
-                players_props[player_key] = []
-            players_props[player_key].append(prop)
-        
+        print(f"{_GREEN}✅ Found {len(player_props)} player props{_RESET}")
+        
+        # One row per prop with the DFS points its line projects
+        frame = pd.DataFrame({
+            'player_name': [prop.player_name for prop in player_props],
+            'team': [prop.team for prop in player_props],
+            'opponent': [prop.opponent for prop in player_props],
+            'sport': [prop.sport for prop in player_props],
+            'points': self._prop_points(player_props),
+        })
+        
+        # Aggregate per player (in first-seen order), then score value column-wise
+        grouped = frame.groupby(['player_name', 'team'], sort=False)
+        players = grouped.agg(opponent=('opponent', 'first'), sport=('sport', 'first'),
+                              projected_points=('points', 'sum'))
+        
+        names = players.index.get_level_values('player_name')
+        salaries = np.array([self._simulate_player_salary(name, player_sport)
+                             for name, player_sport in zip(names, players['sport'])], dtype=np.float64)
+        projected_points = players['projected_points'].to_numpy()
+        value_scores = np.divide(projected_points, salaries / 1000,
+                                 out=np.zeros_like(projected_points), where=salaries > 0)
+        
+        # Sort by value score (stable, so ties keep first-seen order); only the returned players are built
         dfs_values = []
-        
-        for player_key, props in players_props.items():
-            if not props:
-                continue
-                
-            player_name = props[0].player_name
-            team = props[0].team
-            opponent = props[0].opponent
-            sport = props[0].sport
-            
-            # Calculate metrics
-            salary = self._simulate_player_salary(player_name, sport)
-            projected_points = self._calculate_projected_points(props)
-            value_score = projected_points / (salary / 1000) if salary > 0 else 0
+        members = grouped.indices
+        keys = players.index
+        for i in np.argsort(-value_scores, kind='stable')[:top_n]:
+            player_name, team = keys[i]
+            player_sport = players['sport'].iat[i]
             
-            # Calculate confidence score based on prop consistency
-            confidence_score = self._calculate_confidence_score(props)
+            props = [player_props[j] for j in members[keys[i]]]
+            value_score = float(value_scores[i])
             
-            # Calculate recommended exposure
-            recommended_exposure = min(100, max(0, (value_score - 2.5) * 20))
-            
-            # Group props by market
+            # Latest prop per market
             prop_analysis = {}
             for prop in props:
                 prop_analysis[prop.market] = prop
             
-            dfs_value = DFSPlayerValue(
+            dfs_values.append(DFSPlayerValue(
                 player_name=player_name,
                 team=team,
-                opponent=opponent,
-                sport=sport,
-                position=self._get_player_position(player_name, sport),
-                salary=salary,
-                projected_points=projected_points,
+                opponent=players['opponent'].iat[i],
+                sport=player_sport,
+                position=self._get_player_position(player_name, player_sport),
+                salary=int(salaries[i]),
+                projected_points=float(projected_points[i]),
                 prop_analysis=prop_analysis,
                 value_score=value_score,
-                confidence_score=confidence_score,
-                recommended_exposure=recommended_exposure
-            )
-            
-            dfs_values.append(dfs_value)
-        
-        # Sort by value score
-        dfs_values.sort(key=lambda x: x.value_score, reverse=True)
+                confidence_score=self._calculate_confidence_score(props),
+                recommended_exposure=min(100, max(0, (value_score - 2.5) * 20))
+            ))
         
         return dfs_values
     
@@ -322,6 +447,10 @@ class DFSPlayerPropsAnalyzer:
     
     def _get_player_position(self, player_name: str, sport: str) -> str:
         """Get player position (simplified)"""
+        position = self._position_cache.get((player_name, sport))
+        if position is not None:
+            return position
+        
         # In real implementation, this would come from a player database
         positions = {
             'basketball_nba': ['PG', 'SG', 'SF', 'PF', 'C'],
@@ -329,7 +458,9 @@ class DFSPlayerPropsAnalyzer:
         }
         
         sport_positions = positions.get(sport, ['FLEX'])
-        return sport_positions[hash(player_name) % len(sport_positions)]
+        position = sport_positions[zlib.crc32(player_name.encode()) % len(sport_positions)]
+        self._position_cache[(player_name, sport)] = position
+        return position
     
     def find_prop_arbitrage(self, player_props: List[PlayerProp]) -> List[Dict]:
         """
@@ -342,42 +473,52 @@ class DFSPlayerPropsAnalyzer:
             List of arbitrage opportunities
         """
         arbitrage_opportunities = []
-        
-        # Group props by player and market
-        prop_groups = {}
-        for prop in player_props:
-            key = f"{prop.player_name}_{prop.market}"
-            if key not in prop_groups:
-                prop_groups[key] = []
-            prop_groups[key].append(prop)
-        
-        for key, props in prop_groups.items():
-            if len(props) < 2:
-                continue
-            
-            # Find best over and under odds
-            best_over = max(props, key=lambda x: x.over_odds)
-            best_under = max(props, key=lambda x: x.under_odds)
+        if not player_props:
+            return arbitrage_opportunities
+        
+        count = len(player_props)
+        frame = pd.DataFrame({
+            'player_name': [prop.player_name for prop in player_props],
+            'market': [prop.market for prop in player_props],
+            'over_odds': np.fromiter((prop.over_odds for prop in player_props), dtype=np.float64, count=count),
+            'under_odds': np.fromiter((prop.under_odds for prop in player_props), dtype=np.float64, count=count),
+        })
+        
+        # Best over and under per player and market (first book on ties), quoted by 2+ books
+        best = frame.groupby(['player_name', 'market'], sort=False).agg(
+            prop_count=('over_odds', 'size'),
+            over_idx=('over_odds', 'idxmax'),
+            under_idx=('under_odds', 'idxmax'))
+        best = best[best['prop_count'] >= 2]
+        over_idx = best['over_idx'].to_numpy()
+        under_idx = best['under_idx'].to_numpy()
+        
+        # Calculate arbitrage for every group at once
+        best_over_odds = frame['over_odds'].to_numpy()[over_idx]
+        best_under_odds = frame['under_odds'].to_numpy()[under_idx]
+        if NUMBA_AVAILABLE:
+            arbitrage_pct, profit_margin = _prop_arbitrage_kernel(best_over_odds, best_under_odds)
+        else:
+            arbitrage_pct = 1.0 / best_over_odds + 1.0 / best_under_odds
+            profit_margin = (1.0 - arbitrage_pct) * 100.0
+        
+        for i in np.flatnonzero(arbitrage_pct < 1.0):
+            best_over = player_props[over_idx[i]]
+            best_under = player_props[under_idx[i]]
             
-            # Calculate arbitrage
-            arbitrage_pct = (1 / best_over.over_odds) + (1 / best_under.under_odds)
+            opportunity = {
+                'player_name': best_over.player_name,
+                'market': best_over.market,
+                'line': best_over.line,
+                'over_odds': best_over.over_odds,
+                'over_bookmaker': best_over.bookmaker,
+                'under_odds': best_under.under_odds,
+                'under_bookmaker': best_under.bookmaker,
+                'arbitrage_percentage': float(arbitrage_pct[i]),
+                'profit_margin': float(profit_margin[i])
+            }
             
-            if arbitrage_pct < 1.0:
-                profit_margin = (1 - arbitrage_pct) * 100
-                
-                opportunity = {
-                    'player_name': best_over.player_name,
-                    'market': best_over.market,
-                    'line': best_over.line,
-                    'over_odds': best_over.over_odds,
-                    'over_bookmaker': best_over.bookmaker,
-                    'under_odds': best_under.under_odds,
-                    'under_bookmaker': best_under.bookmaker,
-                    'arbitrage_percentage': arbitrage_pct,
-                    'profit_margin': profit_margin
-                }
-                
-                arbitrage_opportunities.append(opportunity)
+            arbitrage_opportunities.append(opportunity)
         
         return arbitrage_opportunities
     
@@ -390,29 +531,31 @@ class DFSPlayerPropsAnalyzer:
             top_n: Number of top players to display
         """
         if not dfs_values:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}📊 No DFS value analysis available.{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}📊 No DFS value analysis available.{_RESET}")
             return
         
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}💎 TOP DFS VALUE PLAYERS{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print("=" * 80)
+        lines = [f"\n{_GREEN}💎 TOP DFS VALUE PLAYERS{_RESET}", "=" * 80]
+        append = lines.append
         
         for i, player in enumerate(dfs_values[:top_n], 1):
-            print(f"\n{Fore.CYAN if COLORS_AVAILABLE else ''}🏀 PLAYER #{i}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-            print(f"Name: {player.player_name} ({player.position})")
-            print(f"Team: {player.team} vs {player.opponent}")
-            print(f"Salary: ${player.salary:,}")
-            print(f"Projected Points: {player.projected_points:.2f}")
-            print(f"Value Score: {player.value_score:.2f} (pts per $1K)")
-            print(f"Confidence: {player.confidence_score:.0f}%")
-            print(f"Recommended Exposure: {player.recommended_exposure:.0f}%")
+            append(f"\n{_CYAN}🏀 PLAYER #{i}{_RESET}")
+            append(f"Name: {player.player_name} ({player.position})")
+            append(f"Team: {player.team} vs {player.opponent}")
+            append(f"Salary: ${player.salary:,}")
+            append(f"Projected Points: {player.projected_points:.2f}")
+            append(f"Value Score: {player.value_score:.2f} (pts per $1K)")
+            append(f"Confidence: {player.confidence_score:.0f}%")
+            append(f"Recommended Exposure: {player.recommended_exposure:.0f}%")
             
             if player.prop_analysis:
-                print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}📈 Player Props:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+                append(f"\n{_YELLOW}📈 Player Props:{_RESET}")
                 for market, prop in player.prop_analysis.items():
                     market_display = market.replace('player_', '').replace('_', ' ').title()
-                    print(f"  • {market_display}: {prop.line} (O/U: {prop.over_odds:.2f}/{prop.under_odds:.2f})")
+                    append(f"  • {market_display}: {prop.line} (O/U: {prop.over_odds:.2f}/{prop.under_odds:.2f})")
             
-            print("-" * 80)
+            append("-" * 80)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_prop_arbitrage(self, arbitrage_opportunities: List[Dict]):
         """
@@ -422,34 +565,36 @@ class DFSPlayerPropsAnalyzer:
             arbitrage_opportunities: List of arbitrage opportunities
         """
         if not arbitrage_opportunities:
-            print(f"{Fore.YELLOW if COLORS_AVAILABLE else ''}📊 No player prop arbitrage opportunities found.{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"{_YELLOW}📊 No player prop arbitrage opportunities found.{_RESET}")
             return
         
-        print(f"\n{Fore.GREEN if COLORS_AVAILABLE else ''}🎯 PLAYER PROP ARBITRAGE OPPORTUNITIES: {len(arbitrage_opportunities)}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-        print("=" * 80)
+        lines = [f"\n{_GREEN}🎯 PLAYER PROP ARBITRAGE OPPORTUNITIES: {len(arbitrage_opportunities)}{_RESET}", "=" * 80]
+        append = lines.append
         
         for i, opp in enumerate(arbitrage_opportunities, 1):
-            print(f"\n{Fore.CYAN if COLORS_AVAILABLE else ''}📋 PROP ARBITRAGE #{i}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-            print(f"Player: {opp['player_name']}")
-            print(f"Market: {opp['market'].replace('player_', '').replace('_', ' ').title()}")
-            print(f"Line: {opp['line']}")
-            print(f"Profit Margin: {opp['profit_margin']:.2f}%")
+            append(f"\n{_CYAN}📋 PROP ARBITRAGE #{i}{_RESET}")
+            append(f"Player: {opp['player_name']}")
+            append(f"Market: {opp['market'].replace('player_', '').replace('_', ' ').title()}")
+            append(f"Line: {opp['line']}")
+            append(f"Profit Margin: {opp['profit_margin']:.2f}%")
             
-            print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}💰 BETTING STRATEGY:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-            print(f"  • Bet OVER {opp['line']} at odds {opp['over_odds']:.2f} with {opp['over_bookmaker']}")
-            print(f"  • Bet UNDER {opp['line']} at odds {opp['under_odds']:.2f} with {opp['under_bookmaker']}")
+            append(f"\n{_YELLOW}💰 BETTING STRATEGY:{_RESET}")
+            append(f"  • Bet OVER {opp['line']} at odds {opp['over_odds']:.2f} with {opp['over_bookmaker']}")
+            append(f"  • Bet UNDER {opp['line']} at odds {opp['under_odds']:.2f} with {opp['under_bookmaker']}")
             
-            print("-" * 80)
+            append("-" * 80)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Main function for DFS player props analysis"""
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}💎 DFS Player Props Analyzer{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
-    print(f"{Fore.MAGENTA if COLORS_AVAILABLE else ''}============================={Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+    print(f"{_MAGENTA}💎 DFS Player Props Analyzer{_RESET}")
+    print(f"{_MAGENTA}============================={_RESET}")
     
     # Check if API key is configured
     if config.API_KEY == 'YOUR_API_KEY_HERE' or not config.API_KEY:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ Please configure your API key in config.py or .env file{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_RED}❌ Please configure your API key in config.py or .env file{_RESET}")
         return
     
     # Initialize analyzer
@@ -459,15 +604,15 @@ def main():
     sport = 'basketball_nba'
     regions = ['us']
     
-    print(f"\n{Fore.BLUE if COLORS_AVAILABLE else ''}⚙️  Configuration:{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+    print(f"\n{_BLUE}⚙️  Configuration:{_RESET}")
     print(f"Sport: {config.AVAILABLE_SPORTS.get(sport, sport)}")
     print(f"Regions: {', '.join(regions)}")
     print(f"Analysis: DFS Value + Prop Arbitrage")
     
     try:
         # Get DFS value analysis
-        dfs_values = analyzer.analyze_dfs_value(sport, regions)
-        analyzer.display_dfs_analysis(dfs_values)
+        dfs_values = analyzer.analyze_dfs_value(sport, regions, top_n=10)
+        analyzer.display_dfs_analysis(dfs_values, top_n=10)
         
         # Get player props for arbitrage analysis
         player_props = analyzer.get_player_props(sport, regions)
@@ -476,12 +621,12 @@ def main():
         
         # Display API usage
         if analyzer.client.requests_remaining:
-            print(f"\n{Fore.BLUE if COLORS_AVAILABLE else ''}📊 API Usage: {analyzer.client.requests_remaining} requests remaining{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+            print(f"\n{_BLUE}📊 API Usage: {analyzer.client.requests_remaining} requests remaining{_RESET}")
     
     except KeyboardInterrupt:
-        print(f"\n{Fore.YELLOW if COLORS_AVAILABLE else ''}⏹️  Analysis stopped by user{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"\n{_YELLOW}⏹️  Analysis stopped by user{_RESET}")
     except Exception as e:
-        print(f"{Fore.RED if COLORS_AVAILABLE else ''}❌ An error occurred: {e}{Style.RESET_ALL if COLORS_AVAILABLE else ''}")
+        print(f"{_RED}❌ An error occurred: {e}{_RESET}")
 
 
 if __name__ == "__main__":
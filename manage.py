@@ -14,7 +14,10 @@ Date: June 2025
 
 import os
 import sys
+import shlex
+import importlib
 import subprocess
+from importlib.metadata import distribution, PackageNotFoundError
 import argparse
 from pathlib import Path
 
@@ -22,18 +25,25 @@ from pathlib import Path
 PROJECT_DIR = Path(__file__).parent.absolute()
 VENV_PYTHON = PROJECT_DIR / "betting_bot" / "bin" / "python"
 
+# Distributions the bot needs at runtime
+REQUIRED_PACKAGES = ('requests', 'colorama', 'python-dotenv', 'tabulate', 'flask')
+
+def venv_is_separate():
+    """Whether the project virtualenv exists but is not the interpreter running manage.py"""
+    return VENV_PYTHON.exists() and Path(sys.prefix).resolve() != VENV_PYTHON.parents[1].resolve()
+
 def get_python_executable():
     """Get the correct Python executable for the current environment"""
     if VENV_PYTHON.exists():
-        return f'"{VENV_PYTHON}"'
+        return str(VENV_PYTHON)
     else:
         return "python"
 
-def run_command(command, description):
-    """Run a shell command with description"""
+def run_command(argv, description):
+    """Run a command (program and arguments as a list) with description"""
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, cwd=PROJECT_DIR, 
+        result = subprocess.run(argv, check=True, cwd=PROJECT_DIR, 
                               capture_output=True, text=True)
         if result.stdout:
             print(result.stdout)
@@ -43,67 +53,74 @@ def run_command(command, description):
         if e.stderr:
             print(f"Error details: {e.stderr}")
         return False
+    except OSError as e:
+        # Without a shell, a missing interpreter surfaces here rather than as an exit status
+        print(f"❌ Error: {e}")
+        return False
+
+def run_script(module_name, args, description):
+    """Run a project script's main() in this interpreter"""
+    # A separate project virtualenv has its own packages, so scripts go through it instead
+    if venv_is_separate():
+        return run_command([get_python_executable(), f'{module_name}.py', *shlex.split(args or '')],
+                           description)
+    
+    print(f"🔧 {description}...")
+    
+    # Present the script with the argv and working directory it would have as a subprocess
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    sys.argv = [f'{module_name}.py', *shlex.split(args or '')]
+    os.chdir(PROJECT_DIR)
+    try:
+        result = importlib.import_module(module_name).main()
+    except SystemExit as e:
+        result = e.code
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+    
+    return not result
 
 def install_dependencies():
     """Install project dependencies"""
     print("📦 Installing dependencies...")
     python_exec = get_python_executable()
-    return run_command(f'{python_exec} -m pip install -r requirements.txt', 
+    return run_command([python_exec, '-m', 'pip', 'install', '-r', 'requirements.txt'],
                       "Installing Python packages")
 
 def run_tests():
     """Run the setup tests"""
     print("🧪 Running setup tests...")
     python_exec = get_python_executable()
-    return run_command(f'{python_exec} test_setup.py', "Running tests")
+    return run_command([python_exec, 'test_setup.py'], "Running tests")
 
 def run_bot(args=None):
     """Run the main arbitrage bot"""
-    python_exec = get_python_executable()
-    cmd = f'{python_exec} arbitrage_bot.py'
-    if args:
-        cmd += f" {args}"
-    return run_command(cmd, "Running arbitrage bot")
+    return run_script('arbitrage_bot', args, "Running arbitrage bot")
 
 def run_cli_bot(args=None):
     """Run the CLI version of the bot"""
-    python_exec = get_python_executable()
-    cmd = f'{python_exec} run_bot.py'
-    if args:
-        cmd += f" {args}"
-    return run_command(cmd, "Running CLI bot")
+    return run_script('run_bot', args, "Running CLI bot")
 
 def run_dfs_analyzer(args=None):
     """Run the DFS props analyzer"""
-    python_exec = get_python_executable()
-    cmd = f'{python_exec} dfs_props_analyzer.py'
-    if args:
-        cmd += f" {args}"
-    return run_command(cmd, "Running DFS props analyzer")
+    return run_script('dfs_props_analyzer', args, "Running DFS props analyzer")
 
 def run_backtest(args=None):
     """Run historical backtesting"""
-    python_exec = get_python_executable()
-    cmd = f'{python_exec} backtest_strategy.py'
-    if args:
-        cmd += f" {args}"
-    return run_command(cmd, "Running backtest")
+    return run_script('backtest_strategy', args, "Running backtest")
 
 def run_real_wnba_analyzer(args=None):
     """Run the real-time WNBA analyzer"""
-    python_exec = get_python_executable()
-    cmd = f'{python_exec} real_wnba_analyzer.py'
-    if args:
-        cmd += f" {args}"
-    return run_command(cmd, "Running real-time WNBA analyzer")
+    return run_script('real_wnba_analyzer', args, "Running real-time WNBA analyzer")
 
 def run_web_app(args=None):
     """Run the web interface"""
     python_exec = get_python_executable()
-    cmd = f'{python_exec} web_app.py'
-    if args:
-        cmd += f" {args}"
-    return run_command(cmd, "Starting web interface")
+    return run_command([python_exec, 'web_app.py', *shlex.split(args or '')], "Starting web interface")
 
 def show_status():
     """Show project status"""
@@ -129,13 +146,30 @@ def show_status():
     except:
         print("❌ Python version: Cannot determine")
     
-    # Check if dependencies are installed
-    try:
-        subprocess.run([python_executable, "-c", "import requests, colorama, dotenv, tabulate, flask"], 
-                      check=True, capture_output=True)
+    # Check if dependencies are installed from their dist-info metadata, without importing them
+    if venv_is_separate():
+        probe = ("import sys; from importlib.metadata import distribution, PackageNotFoundError\n"
+                 "for name in sys.argv[1:]:\n"
+                 "    try: distribution(name)\n"
+                 "    except PackageNotFoundError: print(name)")
+        try:
+            result = subprocess.run([python_executable, "-c", probe, *REQUIRED_PACKAGES],
+                                    check=True, capture_output=True, text=True)
+            missing = result.stdout.split()
+        except:
+            missing = list(REQUIRED_PACKAGES)
+    else:
+        missing = []
+        for package in REQUIRED_PACKAGES:
+            try:
+                distribution(package)
+            except PackageNotFoundError:
+                missing.append(package)
+    
+    if not missing:
         print("✅ Dependencies: Installed")
-    except:
-        print("❌ Dependencies: Missing or incomplete")
+    else:
+        print(f"❌ Dependencies: Missing or incomplete ({', '.join(missing)})")
     
     # Check configuration
     config_file = PROJECT_DIR / "config.py"